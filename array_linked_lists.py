@@ -0,0 +1,421 @@
+# Array-Backed Linked Lists
+# Struct-of-arrays versions of the linked list classes: values and links live in
+# parallel arrays and "pointers" are slot indices, so there is no per-node object.
+
+from array import array
+
+from linked_list_classes import SinglyLinkedList, DoublyLinkedList, CircularLinkedList
+
+NIL = -1  # Index used in place of None for a missing link
+
+
+class _ArrayStorage:
+    """Parallel value/next arrays with a free-slot list threaded through next"""
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        # Typed values are stored unboxed; without a typecode any object is allowed
+        self.values = array(typecode) if typecode else []
+        self.next = array('q')
+        self.free = NIL
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+    def _alloc(self, data):
+        if self.free != NIL:
+            slot = self.free
+            # Store first: a value the typecode rejects must not cost the free slot
+            self.values[slot] = data
+            self.free = self.next[slot]
+            self.next[slot] = NIL
+        else:
+            slot = len(self.next)
+            self.values.append(data)
+            self.next.append(NIL)
+        return slot
+
+    def _release(self, slot):
+        if self.typecode is None:
+            self.values[slot] = None  # Drop the reference so the value can be freed
+        self.next[slot] = self.free
+        self.free = slot
+
+    def capacity(self):
+        """Number of allocated slots, including free ones"""
+        return len(self.next)
+
+
+class ArraySinglyLinkedList(_ArrayStorage):
+    """Singly linked list stored in parallel arrays"""
+
+    def insert_at_beginning(self, data):
+        slot = self._alloc(data)
+        self.next[slot] = self.head
+        self.head = slot
+        if self.tail == NIL:
+            self.tail = slot
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._alloc(data)
+        if self.head == NIL:
+            self.head = self.tail = slot
+        else:
+            self.next[self.tail] = slot
+            self.tail = slot
+        self.size += 1
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        nxt = self.next
+        current = self.head
+        for i in range(index - 1):
+            current = nxt[current]
+        slot = self._alloc(data)
+        nxt[slot] = nxt[current]
+        nxt[current] = slot
+        self.size += 1
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == NIL:
+            return None
+        slot = self.head
+        deleted_data = self.values[slot]
+        self.head = self.next[slot]
+        if self.head == NIL:
+            self.tail = NIL
+        self._release(slot)
+        self.size -= 1
+        return deleted_data
+
+    def delete_from_end(self):
+        if self.head == NIL:
+            return None
+        if self.head == self.tail:
+            return self.delete_from_beginning()
+        nxt = self.next
+        current = self.head
+        while nxt[current] != self.tail:
+            current = nxt[current]
+        slot = self.tail
+        deleted_data = self.values[slot]
+        nxt[current] = NIL
+        self.tail = current
+        self._release(slot)
+        self.size -= 1
+        return deleted_data
+
+    def delete_by_value(self, value):
+        if self.head == NIL:
+            return False
+        if self.values[self.head] == value:
+            self.delete_from_beginning()
+            return True
+        nxt, values = self.next, self.values
+        current = self.head
+        while nxt[current] != NIL and values[nxt[current]] != value:
+            current = nxt[current]
+        slot = nxt[current]
+        if slot == NIL:
+            return False
+        nxt[current] = nxt[slot]
+        if slot == self.tail:
+            self.tail = current
+        self._release(slot)
+        self.size -= 1
+        return True
+
+    def search(self, value):
+        nxt, values = self.next, self.values
+        current = self.head
+        position = 0
+        while current != NIL:
+            if values[current] == value:
+                return position
+            current = nxt[current]
+            position += 1
+        return -1
+
+    def traverse(self):
+        nxt, values = self.next, self.values
+        elements = []
+        current = self.head
+        while current != NIL:
+            elements.append(values[current])
+            current = nxt[current]
+        return elements
+
+
+class ArrayDoublyLinkedList(_ArrayStorage):
+    """Doubly linked list stored in parallel arrays"""
+    def __init__(self, typecode=None):
+        super().__init__(typecode)
+        self.prev = array('q')
+
+    def _alloc(self, data):
+        slot = super()._alloc(data)
+        if slot == len(self.prev):
+            self.prev.append(NIL)
+        else:
+            self.prev[slot] = NIL
+        return slot
+
+    def insert_at_beginning(self, data):
+        slot = self._alloc(data)
+        if self.head == NIL:
+            self.head = self.tail = slot
+        else:
+            self.next[slot] = self.head
+            self.prev[self.head] = slot
+            self.head = slot
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._alloc(data)
+        if self.tail == NIL:
+            self.head = self.tail = slot
+        else:
+            self.prev[slot] = self.tail
+            self.next[self.tail] = slot
+            self.tail = slot
+        self.size += 1
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        nxt, prv = self.next, self.prev
+        current = self.head
+        for i in range(index):
+            current = nxt[current]
+        slot = self._alloc(data)
+        prv[slot] = prv[current]
+        nxt[slot] = current
+        nxt[prv[current]] = slot
+        prv[current] = slot
+        self.size += 1
+        return True
+
+    def _unlink(self, slot):
+        nxt, prv = self.next, self.prev
+        deleted_data = self.values[slot]
+        if prv[slot] != NIL:
+            nxt[prv[slot]] = nxt[slot]
+        else:
+            self.head = nxt[slot]
+        if nxt[slot] != NIL:
+            prv[nxt[slot]] = prv[slot]
+        else:
+            self.tail = prv[slot]
+        self._release(slot)
+        self.size -= 1
+        return deleted_data
+
+    def delete_from_beginning(self):
+        if self.head == NIL:
+            return None
+        return self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail == NIL:
+            return None
+        return self._unlink(self.tail)
+
+    def delete_by_value(self, value):
+        nxt, values = self.next, self.values
+        current = self.head
+        while current != NIL:
+            if values[current] == value:
+                self._unlink(current)
+                return True
+            current = nxt[current]
+        return False
+
+    def search(self, value):
+        nxt, values = self.next, self.values
+        current = self.head
+        position = 0
+        while current != NIL:
+            if values[current] == value:
+                return position
+            current = nxt[current]
+            position += 1
+        return -1
+
+    def traverse_forward(self):
+        nxt, values = self.next, self.values
+        elements = []
+        current = self.head
+        while current != NIL:
+            elements.append(values[current])
+            current = nxt[current]
+        return elements
+
+    def traverse_backward(self):
+        prv, values = self.prev, self.values
+        elements = []
+        current = self.tail
+        while current != NIL:
+            elements.append(values[current])
+            current = prv[current]
+        return elements
+
+
+class ArrayCircularLinkedList(_ArrayStorage):
+    """Circular linked list stored in parallel arrays (next[tail] == head)"""
+
+    def insert_at_beginning(self, data):
+        slot = self._alloc(data)
+        if self.head == NIL:
+            self.next[slot] = slot
+            self.head = self.tail = slot
+        else:
+            self.next[slot] = self.head
+            self.next[self.tail] = slot
+            self.head = slot
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._alloc(data)
+        if self.head == NIL:
+            self.next[slot] = slot
+            self.head = self.tail = slot
+        else:
+            self.next[slot] = self.head
+            self.next[self.tail] = slot
+            self.tail = slot
+        self.size += 1
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        nxt = self.next
+        current = self.head
+        for i in range(index - 1):
+            current = nxt[current]
+        slot = self._alloc(data)
+        nxt[slot] = nxt[current]
+        nxt[current] = slot
+        self.size += 1
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == NIL:
+            return None
+        slot = self.head
+        deleted_data = self.values[slot]
+        if self.head == self.tail:
+            self.head = self.tail = NIL
+        else:
+            self.head = self.next[slot]
+            self.next[self.tail] = self.head
+        self._release(slot)
+        self.size -= 1
+        return deleted_data
+
+    def delete_from_end(self):
+        if self.head == NIL:
+            return None
+        if self.head == self.tail:
+            return self.delete_from_beginning()
+        nxt = self.next
+        current = self.head
+        while nxt[current] != self.tail:
+            current = nxt[current]
+        slot = self.tail
+        deleted_data = self.values[slot]
+        nxt[current] = self.head
+        self.tail = current
+        self._release(slot)
+        self.size -= 1
+        return deleted_data
+
+    def delete_by_value(self, value):
+        if self.head == NIL:
+            return False
+        if self.values[self.head] == value:
+            self.delete_from_beginning()
+            return True
+        nxt, values = self.next, self.values
+        current = self.head
+        while nxt[current] != self.head and values[nxt[current]] != value:
+            current = nxt[current]
+        slot = nxt[current]
+        if slot == self.head:
+            return False
+        nxt[current] = nxt[slot]
+        if slot == self.tail:
+            self.tail = current
+        self._release(slot)
+        self.size -= 1
+        return True
+
+    def search(self, value):
+        nxt, values = self.next, self.values
+        current = self.head
+        for position in range(self.size):
+            if values[current] == value:
+                return position
+            current = nxt[current]
+        return -1
+
+    def traverse(self, max_elements=None):
+        nxt, values = self.next, self.values
+        count = self.size if max_elements is None else min(self.size, max_elements)
+        elements = []
+        current = self.head
+        for i in range(count):
+            elements.append(values[current])
+            current = nxt[current]
+        return elements
+
+
+LIST_BACKENDS = {
+    'object': {
+        'singly': SinglyLinkedList,
+        'doubly': DoublyLinkedList,
+        'circular': CircularLinkedList,
+    },
+    'array': {
+        'singly': ArraySinglyLinkedList,
+        'doubly': ArrayDoublyLinkedList,
+        'circular': ArrayCircularLinkedList,
+    },
+}
+
+
+def create_linked_list(kind, backend='object', typecode=None):
+    """Create an empty 'singly', 'doubly' or 'circular' list on the chosen backend.
+
+    typecode (e.g. 'q' or 'd') only applies to the array backend and stores
+    values unboxed; leave it as None to hold arbitrary Python objects.
+    """
+    if backend not in LIST_BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {sorted(LIST_BACKENDS)}")
+    classes = LIST_BACKENDS[backend]
+    if kind not in classes:
+        raise ValueError(f"Unknown list kind {kind!r}; expected one of {sorted(classes)}")
+    if backend == 'array':
+        return classes[kind](typecode)
+    if typecode is not None:
+        raise ValueError("typecode is only supported by the 'array' backend")
+    return classes[kind]()
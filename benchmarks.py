@@ -0,0 +1,1114 @@
+# Benchmarks
+# Standalone performance checks for the linked list classes.
+# Run with: python benchmarks.py [name ...]   (no names runs everything)
+
+import bisect
+import copy
+import gc
+import multiprocessing
+import os
+import pickle
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+from linked_list_classes import (
+    bulk_build,
+    Node, SinglyNode, DoublyNode, NodePool,
+    SinglyLinkedList, DoublyLinkedList, CircularLinkedList,
+)
+from array_linked_lists import create_linked_list
+from indexable_skip_list import IndexableSkipList
+from skip_list import SkipList
+from unrolled_linked_list import UnrolledLinkedList
+from typed_linked_list import TypedLinkedList, np as numpy_module
+import list_aggregates
+from parallel_lists import parallel_map
+import list_storage
+from persistent_linked_list import PersistentLinkedList, VersionHistory
+from self_organizing_list import SelfOrganizingList, STRATEGIES, uniform_workload, zipf_workload
+
+LIST_CLASSES = {
+    'Singly': SinglyLinkedList,
+    'Doubly': DoublyLinkedList,
+    'Circular': CircularLinkedList,
+}
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, elapsed milliseconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def print_rows(title, rows):
+    """Print a list of dict rows as an aligned text table"""
+    print(f"\n== {title} ==")
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    cells = [[f"{row[h]:.3f}" if isinstance(row[h], float) else str(row[h]) for h in headers] for row in rows]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(headers)]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    for c in cells:
+        print("  ".join(v.ljust(w) for v, w in zip(c, widths)))
+
+
+def build_by_append(list_cls, values):
+    ll = list_cls()
+    for value in values:
+        ll.insert_at_end(value)
+    return ll
+
+
+def bench_tail_append(sizes=(1000, 10000, 100000)):
+    """Bulk construction through insert_at_end should scale linearly"""
+    rows = []
+    for name, list_cls in LIST_CLASSES.items():
+        for size in sizes:
+            _, ms = timed(build_by_append, list_cls, range(size))
+            rows.append({'List': name, 'Size': size, 'Build (ms)': ms, 'us/element': ms * 1000 / size})
+    return rows
+
+
+def link_nodes(node_class, size):
+    """Build a bare forward chain of node_class and return its head"""
+    head = tail = node_class(0)
+    for i in range(1, size):
+        tail.next = node_class(i)
+        tail = tail.next
+    return head
+
+
+def node_getsizeof(node):
+    """Shallow size of one node, including its __dict__ when it has one"""
+    size = sys.getsizeof(node)
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+def bench_node_memory(sizes=(10000, 100000, 1000000)):
+    """Bytes per element for the legacy Node vs the slotted node types"""
+    rows = []
+    for node_class in (Node, DoublyNode, SinglyNode):
+        for size in sizes:
+            tracemalloc.start()
+            head = link_nodes(node_class, size)
+            traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rows.append({
+                'Node': node_class.__name__,
+                'Size': size,
+                'getsizeof (B/node)': node_getsizeof(head),
+                'tracemalloc (B/elem)': traced / size,
+            })
+            del head
+    return rows
+
+
+def traced_build(factory, values):
+    """Build a list with insert_at_end and return (list, ms, traced bytes)"""
+    tracemalloc.start()
+    ll, ms = timed(build_by_append, factory, values)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ll, ms, traced
+
+
+def bench_array_backend(size=200000, searches=20):
+    """Object Node lists vs struct-of-arrays lists: build, traverse, search, memory"""
+    backends = [('object', None), ('array', None), ('array', 'q')]
+    rows = []
+    for kind in ('singly', 'doubly', 'circular'):
+        for backend, typecode in backends:
+            factory = lambda: create_linked_list(kind, backend, typecode)
+            # Build once untraced for timing, once traced for memory
+            ll, build_ms = timed(build_by_append, factory, range(size))
+            del ll
+            ll, _, traced = traced_build(factory, range(size))
+            walk = ll.traverse_forward if kind == 'doubly' else ll.traverse
+            _, traverse_ms = timed(walk)
+            start = time.perf_counter()
+            for i in range(searches):
+                ll.search(size - 1 - i)
+            search_ms = (time.perf_counter() - start) * 1000 / searches
+            rows.append({
+                'Kind': kind,
+                'Backend': backend + (f"[{typecode}]" if typecode else ''),
+                'Build (ms)': build_ms,
+                'Traverse (ms)': traverse_ms,
+                'Search (ms)': search_ms,
+                'B/elem': traced / size,
+            })
+    return rows
+
+
+def bench_bulk_build(sizes=(1000, 100000, 1000000)):
+    """from_iterable / extend vs a per-element insert_at_end loop"""
+    rows = []
+    for name, list_cls in LIST_CLASSES.items():
+        for size in sizes:
+            _, loop_ms = timed(build_by_append, list_cls, range(size))
+            _, bulk_ms = timed(list_cls.from_iterable, range(size))
+            ll = list_cls.from_iterable(range(size))
+            _, extend_ms = timed(ll.extend, (i for i in range(size)))
+            rows.append({
+                'List': name,
+                'Size': size,
+                'Loop (ms)': loop_ms,
+                'from_iterable (ms)': bulk_ms,
+                'extend gen (ms)': extend_ms,
+                'Speedup': loop_ms / bulk_ms,
+            })
+            del ll
+    return rows
+
+
+def bench_value_index(size=100000, lookups=200):
+    """search / membership / delete_by_value latency and memory with the value index on and off"""
+    rnd = random.Random(42)
+    targets = [rnd.randrange(size) for _ in range(lookups)]
+    rows = []
+    for name, list_cls in LIST_CLASSES.items():
+        for indexed in (False, True):
+            tracemalloc.start()
+            ll = list_cls.from_iterable(range(size), indexed=indexed)
+            traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _, contains_ms = timed(lambda: [t in ll for t in targets])
+            _, miss_ms = timed(lambda: [ll.delete_by_value(-t - 1) for t in targets])
+            _, delete_ms = timed(lambda: [ll.delete_by_value(t) for t in targets])
+            rows.append({
+                'List': name,
+                'Indexed': indexed,
+                'contains (us/op)': contains_ms * 1000 / lookups,
+                'delete miss (us/op)': miss_ms * 1000 / lookups,
+                'delete hit (us/op)': delete_ms * 1000 / lookups,
+                'B/elem': traced / size,
+            })
+            del ll
+    return rows
+
+
+def index_pattern(pattern, size, ops, rnd):
+    """Positional indexes for the 'random', 'sequential' and 'clustered' workloads"""
+    if pattern == 'random':
+        return [rnd.randrange(size) for _ in range(ops)]
+    if pattern == 'sequential':
+        start = rnd.randrange(size - ops)
+        return list(range(start, start + ops))
+    indexes = []
+    centre = rnd.randrange(size)
+    for i in range(ops):
+        if i % 50 == 0:
+            centre = rnd.randrange(size)
+        indexes.append(min(size - 1, max(0, centre + rnd.randrange(-32, 33))))
+    return indexes
+
+
+def bench_finger(size=20000, ops=2000):
+    """get + insert_at_index cost per op with the finger cache kept vs cleared each op"""
+    rnd = random.Random(7)
+    rows = []
+    for pattern in ('random', 'sequential', 'clustered'):
+        indexes = index_pattern(pattern, size, ops, rnd)
+        for name, list_cls in LIST_CLASSES.items():
+            result = {'Pattern': pattern, 'List': name}
+            for label, keep in (('no finger (us/op)', False), ('finger (us/op)', True)):
+                ll = list_cls.from_iterable(range(size))
+                start = time.perf_counter()
+                for i in indexes:
+                    if not keep:
+                        ll._finger = None
+                    ll.get(i)
+                    if not keep:
+                        ll._finger = None
+                    ll.insert_at_index(-1, i + 1)
+                result[label] = (time.perf_counter() - start) * 1e6 / (2 * ops)
+            result['Speedup'] = result['no finger (us/op)'] / result['finger (us/op)']
+            rows.append(result)
+    return rows
+
+
+def bench_skip_list_access(sizes=(1000, 10000, 100000), ops=500):
+    """Random get / insert_at_index / delete_at_index: linked lists vs the indexable skip list"""
+    rnd = random.Random(3)
+    rows = []
+    classes = dict(LIST_CLASSES, **{'SkipList': IndexableSkipList})
+    for size in sizes:
+        indexes = [rnd.randrange(size) for _ in range(ops)]
+        for name, list_cls in classes.items():
+            ll = list_cls.from_iterable(range(size))
+            _, get_ms = timed(lambda: [ll.get(i) for i in indexes])
+            _, insert_ms = timed(lambda: [ll.insert_at_index(-1, i) for i in indexes])
+            _, delete_ms = timed(lambda: [ll.delete_at_index(i) for i in indexes])
+            rows.append({
+                'Size': size,
+                'List': name,
+                'get (us/op)': get_ms * 1000 / ops,
+                'insert (us/op)': insert_ms * 1000 / ops,
+                'delete (us/op)': delete_ms * 1000 / ops,
+            })
+    return rows
+
+
+def bench_skip_list_map(size=1000000, lookups=10000, inserts=2000, scans=100, span=1000):
+    """SkipList vs sorted list + bisect vs dict + sort: build, lookup, insert, range scan"""
+    rnd = random.Random(11)
+    keys = rnd.sample(range(size * 4), size)
+    probes = [rnd.choice(keys) for _ in range(lookups)]
+    new_keys = [rnd.randrange(size * 4) * 2 + 1 for _ in range(inserts)]  # Odd, so mostly new
+    scan_starts = [rnd.randrange(size * 4) for _ in range(scans)]
+    rows = []
+
+    def row(name, build_ms, lookup_ms, insert_ms, scan_ms):
+        rows.append({
+            'Structure': name,
+            'Build (ms)': build_ms,
+            'Lookup (us/op)': lookup_ms * 1000 / lookups,
+            'Insert (us/op)': insert_ms * 1000 / inserts,
+            'Range scan (ms/scan)': scan_ms / scans,
+        })
+
+    def build_skip():
+        sl = SkipList(max_level=20, p=0.5, seed=1)
+        for k in keys:
+            sl.insert(k, k)
+        return sl
+    sl, build_ms = timed(build_skip)
+    _, lookup_ms = timed(lambda: [sl.search(k) for k in probes])
+    _, insert_ms = timed(lambda: [sl.insert(k, k) for k in new_keys])
+    _, scan_ms = timed(lambda: [sum(1 for _ in sl.range(lo, lo + span)) for lo in scan_starts])
+    row('SkipList', build_ms, lookup_ms, insert_ms, scan_ms)
+    del sl
+
+    sorted_keys, build_ms = timed(sorted, keys)
+
+    def bisect_lookup(k):
+        i = bisect.bisect_left(sorted_keys, k)
+        return i < len(sorted_keys) and sorted_keys[i] == k
+    _, lookup_ms = timed(lambda: [bisect_lookup(k) for k in probes])
+    _, insert_ms = timed(lambda: [bisect.insort(sorted_keys, k) for k in new_keys])
+    _, scan_ms = timed(lambda: [
+        len(sorted_keys[bisect.bisect_left(sorted_keys, lo):bisect.bisect_left(sorted_keys, lo + span)])
+        for lo in scan_starts])
+    row('sorted list + bisect', build_ms, lookup_ms, insert_ms, scan_ms)
+    del sorted_keys
+
+    mapping, build_ms = timed(dict.fromkeys, keys)
+    _, lookup_ms = timed(lambda: [mapping.get(k) for k in probes])
+    _, insert_ms = timed(lambda: [mapping.__setitem__(k, None) for k in new_keys])
+    # A dict has no order, so every range scan pays for a sort
+    _, scan_ms = timed(lambda: [sum(1 for k in sorted(mapping) if lo <= k < lo + span) for lo in scan_starts[:3]])
+    row('dict + sort', build_ms, lookup_ms, insert_ms, scan_ms * scans / 3)
+    return rows
+
+
+def bench_unrolled_block_size(size=100000, inserts=1000, block_sizes=(4, 8, 16, 32, 64, 128, 256, 512, 1024)):
+    """Block size sweep: traversal, positional insert and memory per element"""
+    rnd = random.Random(5)
+    indexes = [rnd.randrange(size) for _ in range(inserts)]
+    rows = []
+    baseline = ('SinglyLinkedList', lambda: SinglyLinkedList.from_iterable(range(size)))
+    variants = [(f"Unrolled[{b}]", lambda b=b: UnrolledLinkedList.from_iterable(range(size), block_size=b))
+                for b in block_sizes]
+    for name, build in [baseline] + variants:
+        tracemalloc.start()
+        ll = build()
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _, traverse_ms = timed(lambda: sum(1 for _ in ll))
+        _, insert_ms = timed(lambda: [ll.insert_at_index(-1, i) for i in indexes])
+        row = {
+            'List': name,
+            'Traverse (ms)': traverse_ms,
+            'Insert (us/op)': insert_ms * 1000 / inserts,
+            'B/elem': traced / size,
+        }
+        if isinstance(ll, UnrolledLinkedList):
+            row['Fill ratio'] = ll.stats()['fill_ratio']
+        else:
+            row['Fill ratio'] = '-'
+        rows.append(row)
+        del ll
+    return rows
+
+
+def bench_self_organizing(size=1000, lookups=50000):
+    """Average probe length and lookup throughput per strategy under Zipf and uniform skew"""
+    keys = list(range(size))
+    workloads = {
+        'uniform': uniform_workload(keys, lookups, seed=1),
+        'zipf s=1.0': zipf_workload(keys, lookups, s=1.0, seed=1),
+        'zipf s=1.5': zipf_workload(keys, lookups, s=1.5, seed=1),
+    }
+    rows = []
+    for workload_name, workload in workloads.items():
+        for strategy in STRATEGIES:
+            ol = SelfOrganizingList.from_iterable(keys, strategy=strategy)
+            _, ms = timed(lambda: [ol.access(k) for k in workload])
+            stats = ol.stats()
+            rows.append({
+                'Workload': workload_name,
+                'Strategy': strategy,
+                'Avg probes': stats['avg_probe_length'],
+                'Lookups/s': lookups / (ms / 1000),
+            })
+    return rows
+
+
+def _churn_worker(list_name, pooled, live, ops, queue):
+    """Queue churn in a fresh process; reports ops/s, pool stats and peak RSS"""
+    list_cls = LIST_CLASSES[list_name]
+    pool = NodePool(list_cls.node_class, capacity=live) if pooled else None
+    ll = list_cls.from_iterable(range(live), pool=pool)
+    start = time.perf_counter()
+    for i in range(ops):
+        ll.insert_at_end(i)
+        ll.delete_from_beginning()
+        if i % 1000 == 0:
+            # Bursts of deletes followed by refills, as in a draining queue
+            for _ in range(100):
+                ll.delete_from_beginning()
+            ll.extend(range(100))
+    elapsed = time.perf_counter() - start
+    hit_ratio = pool.stats()['hit_ratio'] if pool else 0.0
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((2 * ops / elapsed, hit_ratio, peak_kb))
+
+
+def bench_node_pool(live=100000, ops=500000):
+    """Insert/delete churn with and without a NodePool, each variant in its own process"""
+    rows = []
+    ctx = multiprocessing.get_context()
+    for name in LIST_CLASSES:
+        for pooled in (False, True):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_churn_worker, args=(name, pooled, live, ops, queue))
+            proc.start()
+            ops_per_s, hit_ratio, peak_kb = queue.get()
+            proc.join()
+            rows.append({
+                'List': name,
+                'Pooled': pooled,
+                'ops/s': ops_per_s,
+                'Pool hit ratio': hit_ratio,
+                'Peak RSS (MB)': peak_kb / 1024,
+            })
+    return rows
+
+
+def default_pickle_depth_limit(size=100000):
+    """Whether stock pickling of a bare node chain of this length survives"""
+    head = link_nodes(SinglyNode, size)
+    try:
+        pickle.dumps(head)
+    except RecursionError:
+        return 'RecursionError'
+    return 'ok'
+
+
+def bench_pickle_copy_free(size=1000000):
+    """pickle round trip, deepcopy, clone and teardown of size-node lists"""
+    rows = [{'List': 'bare SinglyNode chain', 'Operation': 'stock pickle.dumps', 'ms': 0.0,
+             'Note': default_pickle_depth_limit()}]
+    for name, list_cls in LIST_CLASSES.items():
+        ll = list_cls.from_iterable(range(size))
+        data, dump_ms = timed(pickle.dumps, ll, pickle.HIGHEST_PROTOCOL)
+        restored, load_ms = timed(pickle.loads, data)
+        copied, deepcopy_ms = timed(copy.deepcopy, ll)
+        cloned, clone_ms = timed(ll.clone)
+        rows.append({'List': name, 'Operation': 'pickle.dumps', 'ms': dump_ms, 'Note': f"{len(data) / size:.1f} B/elem"})
+        rows.append({'List': name, 'Operation': 'pickle.loads', 'ms': load_ms, 'Note': ''})
+        rows.append({'List': name, 'Operation': 'copy.deepcopy', 'ms': deepcopy_ms, 'Note': ''})
+        rows.append({'List': name, 'Operation': 'clone()', 'ms': clone_ms, 'Note': ''})
+        del data, restored, copied
+
+        # Teardown: drop the last reference (plus a full collection for cycles) vs clear()
+        gc.collect()
+
+        def drop_and_collect():
+            nonlocal cloned
+            cloned = None
+            return gc.collect()
+        collected, drop_ms = timed(drop_and_collect)
+        rows.append({'List': name, 'Operation': 'del + gc.collect()', 'ms': drop_ms, 'Note': f"{collected} collected"})
+        _, clear_ms = timed(ll.clear)
+        collected, collect_ms = timed(gc.collect)
+        rows.append({'List': name, 'Operation': 'clear() + gc.collect()', 'ms': clear_ms + collect_ms,
+                     'Note': f"{collected} collected"})
+    return rows
+
+
+def track_gc_pauses():
+    """Install a gc callback recording (generation, ms, collected) per collection"""
+    pauses = []
+    started = []
+
+    def callback(phase, info):
+        if phase == 'start':
+            started.append(time.perf_counter())
+        else:
+            pauses.append((info['generation'], (time.perf_counter() - started.pop()) * 1000, info['collected']))
+    gc.callbacks.append(callback)
+    return pauses, callback
+
+
+def bench_weak_prev(size=1000000, rounds=3):
+    """Drop size-node DoublyLinkedLists with strong vs weak back-pointers, like a rerun replacing state"""
+    rows = []
+    for weak_prev in (False, True):
+        gc.collect()
+        pauses, callback = track_gc_pauses()
+        build_ms = drop_ms = 0.0
+        ll = None
+        for _ in range(rounds):
+            # Replacing the previous list is the drop a Streamlit rerun does
+            new_list, ms = timed(DoublyLinkedList.from_iterable, range(size), weak_prev=weak_prev)
+            build_ms += ms
+            start = time.perf_counter()
+            ll = new_list
+            del new_list
+            drop_ms += (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        ll = None
+        drop_ms += (time.perf_counter() - start) * 1000
+        automatic = list(pauses)
+        collected, collect_ms = timed(gc.collect)
+        gc.callbacks.remove(callback)
+        rows.append({
+            'Mode': 'weak prev' if weak_prev else 'strong prev',
+            'Build (ms)': build_ms / rounds,
+            'Drop (ms)': drop_ms / rounds,
+            'Auto GC runs': len(automatic),
+            'Auto GC total (ms)': sum(ms for _, ms, _ in automatic),
+            'Longest pause (ms)': max((ms for _, ms, _ in automatic), default=0.0),
+            'Auto collected': sum(n for _, _, n in automatic),
+            'Final collect (ms)': collect_ms,
+            'Final collected': collected,
+        })
+    return rows
+
+
+def build_by_insert_at_end(list_cls, size):
+    ll = list_cls()
+    for i in range(size):
+        ll.insert_at_end(i)
+    return ll
+
+
+def bench_bulk_gc(size=1000000):
+    """size-node builds with the cyclic GC running normally vs suspended by bulk_build()"""
+    rows = []
+    for name in ('Singly', 'Doubly'):
+        list_cls = LIST_CLASSES[name]
+        variants = [
+            ('insert_at_end loop', False, False, lambda: build_by_insert_at_end(list_cls, size)),
+            ('insert_at_end loop', True, False, lambda: build_by_insert_at_end(list_cls, size)),
+            ('from_iterable', False, False, lambda: list_cls.from_iterable(range(size))),
+            ('from_iterable', True, False, lambda: list_cls.from_iterable(range(size))),
+            ('from_iterable', True, True, lambda: list_cls.from_iterable(range(size))),
+        ]
+        for label, bulk, freeze, build in variants:
+            gc.collect()
+            pauses, callback = track_gc_pauses()
+            # from_iterable enters bulk_build itself past bulk_gc_threshold; lift it for the "off" rows
+            list_cls.bulk_gc_threshold = sys.maxsize
+            start = time.perf_counter()
+            if bulk:
+                with bulk_build(freeze=freeze) as report:
+                    ll = build()
+            else:
+                ll = build()
+            build_ms = (time.perf_counter() - start) * 1000
+            del list_cls.bulk_gc_threshold
+            gc.callbacks.remove(callback)
+            # A full collection afterwards shows what the finished list costs later passes
+            _, full_ms = timed(gc.collect, 2)
+            rows.append({
+                'List': name,
+                'Build': label,
+                'GC mode': ('bulk_build + freeze' if freeze else 'bulk_build') if bulk else 'default',
+                'Build (ms)': build_ms,
+                'GC runs': len(pauses),
+                'GC total (ms)': sum(ms for _, ms, _ in pauses),
+                'Max pause (ms)': max((ms for _, ms, _ in pauses), default=0.0),
+                'Next full GC (ms)': full_ms,
+            })
+            del ll
+            if freeze:
+                gc.unfreeze()
+            gc.collect()
+    return rows
+
+
+def version_ops(size, versions, workload, seed=0):
+    """(kind, index, value) edits: 'front' pushes/pops at the head, 'random' edits anywhere"""
+    rnd = random.Random(seed)
+    ops = []
+    length = size
+    for i in range(versions):
+        insert = length == 0 or rnd.random() < 0.5
+        index = 0 if workload == 'front' else rnd.randrange(length + 1 if insert else length)
+        ops.append(('insert' if insert else 'delete', index, i))
+        length += 1 if insert else -1
+    return ops
+
+
+def keep_persistent_versions(size, ops):
+    history = VersionHistory(PersistentLinkedList(range(size)))
+    for kind, index, value in ops:
+        if kind == 'insert':
+            history.apply('insert_at_index', value, index)
+        else:
+            history.apply('delete_at_index', index)
+    return history
+
+
+def keep_snapshot_versions(size, ops):
+    ll = SinglyLinkedList.from_iterable(range(size))
+    snapshots = [copy.deepcopy(ll)]
+    for kind, index, value in ops:
+        if kind == 'insert':
+            ll.insert_at_index(value, index)
+        else:
+            ll.delete_at_index(index)
+        snapshots.append(copy.deepcopy(ll))
+    return snapshots
+
+
+def bench_persistent_versions(size=200, versions=10000):
+    """Keep every version of a list: structural sharing vs a deepcopy snapshot per change"""
+    rows = []
+    for workload in ('front', 'random'):
+        ops = version_ops(size, versions, workload)
+        for label, keep in (('PersistentLinkedList + VersionHistory', keep_persistent_versions),
+                            ('SinglyLinkedList + deepcopy snapshots', keep_snapshot_versions)):
+            kept, ms = timed(keep, size, ops)
+            del kept
+            tracemalloc.start()
+            kept = keep(size, ops)
+            traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rows.append({
+                'Workload': workload,
+                'History': label,
+                'Versions': versions + 1,
+                'Total (ms)': ms,
+                'Per change (us)': ms * 1000 / versions,
+                'Memory (MB)': traced / 1e6,
+                'B/version': traced / (versions + 1),
+            })
+            del kept
+    return rows
+
+
+def sort_input(pattern, size, seed=0):
+    rnd = random.Random(seed)
+    if pattern == 'reversed':
+        return list(range(size, 0, -1))
+    values = list(range(size))
+    if pattern == 'random':
+        rnd.shuffle(values)
+    else:
+        # nearly sorted: 1% of positions swapped with a random partner
+        for _ in range(size // 100):
+            i, j = rnd.randrange(size), rnd.randrange(size)
+            values[i], values[j] = values[j], values[i]
+    return values
+
+
+def bench_sort(sizes=(10000, 100000, 1000000), patterns=('random', 'nearly sorted', 'reversed')):
+    """In-place natural merge sort vs sorted(list(ll)) plus a rebuild"""
+    rows = []
+    for size in sizes:
+        for pattern in patterns:
+            values = sort_input(pattern, size)
+            for name, list_cls in LIST_CLASSES.items():
+                ll = list_cls.from_iterable(values)
+                _, sort_ms = timed(ll.sort)
+                ll = list_cls.from_iterable(values)
+                _, rebuild_ms = timed(lambda: list_cls.from_iterable(sorted(list(ll))))
+                rows.append({
+                    'Size': size,
+                    'Input': pattern,
+                    'List': name,
+                    'sort() (ms)': sort_ms,
+                    'sorted + rebuild (ms)': rebuild_ms,
+                    'Ratio': sort_ms / rebuild_ms if rebuild_ms else 0.0,
+                })
+                del ll
+    return rows
+
+
+def bench_splice(size=100000, rotations=100000):
+    """Pointer-surgery concat/splice/split/rotate vs moving elements one by one"""
+    rows = []
+    for name, list_cls in LIST_CLASSES.items():
+        a, b = list_cls.from_iterable(range(size)), list_cls.from_iterable(range(size))
+        _, surgery_ms = timed(a.concat, b)
+
+        def concat_by_insert(a=list_cls.from_iterable(range(size)), b=list_cls.from_iterable(range(size))):
+            for value in b:
+                a.insert_at_end(value)
+            b.clear()
+        _, copy_ms = timed(concat_by_insert)
+        rows.append({'List': name, 'Operation': f"concat {size:,} + {size:,}", 'Surgery (ms)': surgery_ms, 'Element by element (ms)': copy_ms,
+                     'Note': 'baseline: insert_at_end per value'})
+
+        a, b = list_cls.from_iterable(range(size)), list_cls.from_iterable(range(size))
+        _, surgery_ms = timed(a.splice, size // 2, b)
+        a = list_cls.from_iterable(range(size))
+        _, copy_ms = timed(a.insert_many_at_index, list(range(size)), size // 2)
+        rows.append({'List': name, 'Operation': 'splice at middle', 'Surgery (ms)': surgery_ms, 'Element by element (ms)': copy_ms,
+                     'Note': 'baseline: insert_many_at_index of copied values'})
+
+        a = list_cls.from_iterable(range(size))
+        _, surgery_ms = timed(a.split_at, size // 2)
+        a = list_cls.from_iterable(range(size))
+
+        def split_by_copy(a=a):
+            return list_cls.from_iterable(a.islice(0, size // 2)), list_cls.from_iterable(a.islice(size // 2))
+        _, copy_ms = timed(split_by_copy)
+        rows.append({'List': name, 'Operation': 'split_at middle', 'Surgery (ms)': surgery_ms, 'Element by element (ms)': copy_ms,
+                     'Note': 'baseline: rebuild both halves'})
+
+    # Round-robin: advance the queue one step at a time
+    ring = CircularLinkedList.from_iterable(range(size))
+    _, rotate_ms = timed(lambda: [ring.rotate(-1) for _ in range(rotations)])
+    ring = CircularLinkedList.from_iterable(range(size))
+
+    def requeue():
+        for _ in range(rotations):
+            ring.insert_at_end(ring.delete_from_beginning())
+    _, requeue_ms = timed(requeue)
+    rows.append({'List': 'Circular', 'Operation': f"{rotations:,} round-robin steps", 'Surgery (ms)': rotate_ms,
+                 'Element by element (ms)': requeue_ms, 'Note': 'rotate(-1) vs delete_from_beginning + insert_at_end'})
+    return rows
+
+
+def edit_by_cursor(ll):
+    """Editor-style pass: drop multiples of 3, insert a marker after multiples of 5"""
+    for cursor in ll.cursors():
+        value = cursor.value
+        if value % 3 == 0:
+            cursor.remove()
+        elif value % 5 == 0:
+            cursor.insert_after(-value)
+            cursor.move_next()
+
+
+def edit_by_index(ll, keep_finger=True):
+    index = 0
+    while index < ll.size:
+        if not keep_finger:
+            ll._finger = None
+        value = ll.get(index)
+        if value % 3 == 0:
+            if not keep_finger:
+                ll._finger = None
+            ll.delete_at_index(index)
+            continue
+        if value % 5 == 0:
+            if not keep_finger:
+                ll._finger = None
+            ll.insert_at_index(-value, index + 1)
+            index += 1
+        index += 1
+
+
+def bench_cursor(size=20000, fingerless_size=2000):
+    """One local-edit pass over the list: cursor vs index-based edits, with the finger kept or cleared"""
+    rows = []
+    for name, list_cls in LIST_CLASSES.items():
+        for n, keep_finger in ((size, True), (fingerless_size, False)):
+            ll = list_cls.from_iterable(range(1, n + 1))
+            _, cursor_ms = timed(edit_by_cursor, ll)
+            expected = list(ll)
+            ll = list_cls.from_iterable(range(1, n + 1))
+            _, index_ms = timed(edit_by_index, ll, keep_finger)
+            assert list(ll) == expected
+            rows.append({
+                'List': name,
+                'Size': n,
+                'Index edits': 'finger kept' if keep_finger else 'finger cleared',
+                'Cursor (ms)': cursor_ms,
+                'Index (ms)': index_ms,
+                'Speedup': index_ms / cursor_ms,
+            })
+    return rows
+
+
+def matching_values(size, fraction, seed=0):
+    """size values where about fraction of them are 0 (the value to remove)"""
+    rnd = random.Random(seed)
+    return [0 if rnd.random() < fraction else rnd.randrange(1, 1000) for _ in range(size)]
+
+
+def remove_all_by_repeated_delete(ll, value):
+    while ll.delete_by_value(value):
+        pass
+
+
+def bench_remove_all(size=100000, loop_size=10000, fractions=(0.01, 0.5, 0.99)):
+    """remove_all / remove_if in one pass vs repeated delete_by_value and a filtered rebuild"""
+    rows = []
+    for fraction in fractions:
+        values = matching_values(size, fraction)
+        small = values[:loop_size]
+        for name, list_cls in LIST_CLASSES.items():
+            ll = list_cls.from_iterable(values)
+            _, remove_all_ms = timed(ll.remove_all, 0)
+            ll = list_cls.from_iterable(values)
+            _, remove_if_ms = timed(ll.remove_if, lambda value: value == 0)
+            ll = list_cls.from_iterable(values)
+            _, rebuild_ms = timed(lambda: list_cls.from_iterable(value for value in ll if value != 0))
+            ll = list_cls.from_iterable(small)
+            _, one_pass_ms = timed(ll.remove_all, 0)
+            ll = list_cls.from_iterable(small)
+            _, loop_ms = timed(remove_all_by_repeated_delete, ll, 0)
+            ll = list_cls.from_iterable(values)
+            _, dedupe_ms = timed(ll.dedupe)
+            rows.append({
+                'Matching': f"{fraction:.0%}",
+                'List': name,
+                'remove_all (ms)': remove_all_ms,
+                'remove_if (ms)': remove_if_ms,
+                'Filtered rebuild (ms)': rebuild_ms,
+                'dedupe (ms)': dedupe_ms,
+                f"remove_all @{loop_size} (ms)": one_pass_ms,
+                f"delete_by_value loop @{loop_size} (ms)": loop_ms,
+            })
+    return rows
+
+
+def queue_workload(container, size):
+    append = container.append
+    for i in range(size):
+        append(i)
+    popleft = container.popleft if hasattr(container, 'popleft') else lambda: container.pop(0)
+    for i in range(size):
+        popleft()
+
+
+def stack_workload(container, size):
+    append = container.append
+    pop = container.pop
+    for i in range(size):
+        append(i)
+    for i in range(size):
+        pop()
+
+
+def window_workload(factory, size, window):
+    """Running sum over a sliding window, with the window bounded by maxlen or trimmed by hand"""
+    container = factory(window)
+    total = 0
+    for i in range(size):
+        if getattr(container, 'maxlen', None) is None and len(container) == window:
+            total -= container.pop(0)
+        elif len(container) == window:
+            total -= container[0]
+        container.append(i)
+        total += i
+    return total
+
+
+def rotate_workload(container, steps):
+    if hasattr(container, 'rotate'):
+        for i in range(steps):
+            container.rotate(1)
+    else:
+        for i in range(steps):
+            container.insert(0, container.pop())
+
+
+def random_access_workload(container, indexes):
+    for i in indexes:
+        container[i]
+
+
+def bench_deque(size=100000, window=64, rotations=10000, accesses=1000):
+    """DoublyLinkedList's deque API against collections.deque and list"""
+    rnd = random.Random(5)
+    indexes = [rnd.randrange(size) for _ in range(accesses)]
+    contenders = {
+        'DoublyLinkedList': lambda maxlen=None: DoublyLinkedList(maxlen=maxlen),
+        'collections.deque': lambda maxlen=None: deque(maxlen=maxlen),
+        'list': lambda maxlen=None: [],
+    }
+    rows = []
+    for name, factory in contenders.items():
+        _, queue_ms = timed(queue_workload, factory(), size)
+        _, stack_ms = timed(stack_workload, factory(), size)
+        _, window_ms = timed(window_workload, factory, size, window)
+        filled = factory()
+        filled.extend(range(size))
+        _, rotate_ms = timed(rotate_workload, filled, rotations)
+        _, access_ms = timed(random_access_workload, filled, indexes)
+        rows.append({
+            'Structure': name,
+            f"FIFO queue {size:,} (ms)": queue_ms,
+            f"LIFO stack {size:,} (ms)": stack_ms,
+            f"Window {window} (ms)": window_ms,
+            f"rotate(1) x{rotations:,} (ms)": rotate_ms,
+            f"Random [i] x{accesses:,} (ms)": access_ms,
+        })
+    return rows
+
+
+def walk_sum(head):
+    """calculate_sum_singly from the tutorial: follow next pointers, adding boxed values"""
+    total = 0
+    current = head
+    while current:
+        total += current.data
+        current = current.next
+    return total
+
+
+def node_aggregates(ll):
+    return {
+        'sum': lambda: walk_sum(ll.head),
+        'mean': lambda: walk_sum(ll.head) / ll.size,
+        'min': lambda: min(ll),
+        'max': lambda: max(ll),
+    }
+
+
+def typed_aggregates(ll):
+    return {'sum': ll.sum, 'mean': ll.mean, 'min': ll.min, 'max': ll.max}
+
+
+def bench_typed_numeric(size=1000000, block_size=1024):
+    """Boxed Node lists vs TypedLinkedList chunks: memory and sum/mean/min/max"""
+    rnd = random.Random(9)
+    datasets = {
+        'int64': ('q', [rnd.randrange(-10**9, 10**9) for _ in range(size)]),
+        'float64': ('d', [rnd.random() * 1e6 for _ in range(size)]),
+    }
+    aggregate_path = 'numpy.frombuffer per chunk' if numpy_module is not None else 'builtins per chunk (NumPy not installed)'
+    rows = []
+    for dtype, (typecode, values) in datasets.items():
+        builders = [
+            ('SinglyLinkedList', lambda: SinglyLinkedList.from_iterable(values), node_aggregates),
+            ('DoublyLinkedList', lambda: DoublyLinkedList.from_iterable(values), node_aggregates),
+            (f"TypedLinkedList('{typecode}')", lambda: TypedLinkedList.from_iterable(values, typecode=typecode, block_size=block_size), typed_aggregates),
+        ]
+        baseline = None
+        for name, build, aggregates in builders:
+            # Values are already alive in `values`, so for boxed lists this counts nodes only;
+            # freshly built values would add a boxed int/float (24-32 B) per element on top
+            gc.collect()
+            tracemalloc.start()
+            ll = build()
+            traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del ll
+            ll, build_ms = timed(build)
+            row = {'Values': dtype, 'Structure': name, 'B/elem': traced / size, 'Build (ms)': build_ms}
+            for op, func in aggregates(ll).items():
+                _, row[f"{op} (ms)"] = timed(func)
+            if baseline is None:
+                baseline = row
+            row['Aggregate speedup'] = sum(baseline[f"{op} (ms)"] for op in ('sum', 'mean', 'min', 'max')) / \
+                sum(row[f"{op} (ms)"] for op in ('sum', 'mean', 'min', 'max'))
+            row['Aggregates via'] = aggregate_path if aggregates is typed_aggregates else 'node walk / iteration'
+            rows.append(row)
+            del ll
+    return rows
+
+
+def walk_kernels(ll, bins=10):
+    """Per-node baseline: each aggregate walks the nodes and works on boxed values"""
+    total = walk_sum(ll.head)
+    low, high = min(ll), max(ll)
+    prefix = list(accumulate(ll))
+    width = (high - low) / bins or 1.0
+    counts = [0] * bins
+    for value in ll:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+    return total, total / ll.size, low, high, prefix, counts
+
+
+def vectorized_kernels(values, bins=10):
+    total = list_aggregates.total(values)
+    low, high = list_aggregates.minmax(values)
+    prefix = list_aggregates.prefix_sums(values)
+    counts, _ = list_aggregates.histogram(values, bins)
+    return total, total / len(values), low, high, prefix, counts
+
+
+def per_call_ms(func, size, work=200000):
+    """Average ms of func over enough calls to cover about `work` elements"""
+    rounds = max(1, work // size)
+    _, elapsed = timed(lambda: [func() for _ in range(rounds)])
+    return elapsed / rounds
+
+
+def bench_aggregate_crossover(sizes=(10, 100, 1000, 10000, 100000, 1000000)):
+    """Per-node aggregate walks vs one gather pass plus vectorized kernels"""
+    rnd = random.Random(23)
+    kernels_via = 'NumPy' if list_aggregates.np is not None else 'array + builtins (NumPy not installed)'
+    rows = []
+    for size in sizes:
+        ll = SinglyLinkedList.from_iterable(rnd.random() * 1000 for _ in range(size))
+        walk_ms = per_call_ms(lambda: walk_kernels(ll), size)
+        gather_ms = per_call_ms(lambda: list_aggregates.gather(ll), size)
+        values = list_aggregates.gather(ll)
+        kernel_ms = per_call_ms(lambda: vectorized_kernels(values), size)
+        # Once gathered, the buffer can serve any number of further aggregates
+        rows.append({
+            'Size': size,
+            'Node walks (ms)': walk_ms,
+            'Gather (ms)': gather_ms,
+            'Kernels (ms)': kernel_ms,
+            'Speedup': walk_ms / (gather_ms + kernel_ms),
+            'Gather repaid': 'yes' if gather_ms + kernel_ms < walk_ms else 'no',
+            'Kernels via': kernels_via,
+        })
+        del ll, values
+    return rows
+
+
+def mix_bits(value, rounds=20):
+    """CPU-bound per-value work for the parallel benchmark (module level, so it pickles)"""
+    for _ in range(rounds):
+        value = (value * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+    return value >> 33
+
+
+def bench_parallel_scaling(size=1000000, workers=(1, 2, 4, 8)):
+    """parallel_map on 1..8 warm worker processes vs a single-core traversal"""
+    ll = SinglyLinkedList.from_iterable(range(size))
+    expected, serial_ms = timed(lambda: [mix_bits(value) for value in ll])
+    rows = [{'Workers': 'serial', 'Wall (ms)': serial_ms, 'Split (ms)': 0.0, 'Transfer (ms)': 0.0,
+             'Compute (ms)': serial_ms, 'Merge (ms)': 0.0, 'Speedup': 1.0, 'CPUs': os.cpu_count()}]
+    for count in workers:
+        with ProcessPoolExecutor(max_workers=count) as pool:
+            # Start every worker first so process startup is not billed as transfer
+            list(pool.map(abs, range(count)))
+            stats = {}
+            result, wall_ms = timed(parallel_map, ll, mix_bits, typecode='q', executor=pool, stats=stats, workers=count)
+        assert result == expected
+        rows.append({
+            'Workers': count,
+            'Wall (ms)': wall_ms,
+            'Split (ms)': stats['split_ms'],
+            'Transfer (ms)': stats['transfer_ms'],
+            # Summed over workers; ideally it stays near the serial time while wall time drops
+            'Compute (ms)': stats['compute_ms'],
+            'Merge (ms)': stats['merge_ms'],
+            'Speedup': serial_ms / wall_ms,
+            'CPUs': os.cpu_count(),
+        })
+    return rows
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _storage_worker(fmt, phase, path, size, queue):
+    """Save or load one file in a fresh process; reports ms, traversal ms and RSS"""
+    if phase == 'save':
+        ll = SinglyLinkedList.from_iterable(range(size))
+        before = peak_rss_mb()
+        start = time.perf_counter()
+        if fmt == 'pickle':
+            with open(path, 'wb') as f:
+                pickle.dump(ll, f, pickle.HIGHEST_PROTOCOL)
+        else:
+            list_storage.save(ll, path)
+        elapsed = (time.perf_counter() - start) * 1000
+        queue.put((elapsed, 0.0, before, peak_rss_mb()))
+        return
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    if fmt == 'pickle':
+        with open(path, 'rb') as f:
+            ll = pickle.load(f)
+    else:
+        ll = list_storage.load(path, mmap=(fmt == 'binary mmap'))
+    load_ms = (time.perf_counter() - start) * 1000
+    total, traverse_ms = timed(sum, ll)
+    assert total == size * (size - 1) // 2
+    queue.put((load_ms, traverse_ms, before, peak_rss_mb()))
+
+
+def bench_list_storage(size=10000000):
+    """list_storage binary files (eager and mmap) vs pickle: throughput and peak RSS"""
+    ctx = multiprocessing.get_context()
+    directory = tempfile.mkdtemp()
+    paths = {'binary': os.path.join(directory, 'list.bin'), 'pickle': os.path.join(directory, 'list.pickle')}
+    plan = [('binary', 'save'), ('pickle', 'save'), ('binary', 'load'), ('binary mmap', 'load'), ('pickle', 'load')]
+    rows = []
+    try:
+        for fmt, phase in plan:
+            path = paths['pickle' if fmt == 'pickle' else 'binary']
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_storage_worker, args=(fmt, phase, path, size, queue))
+            proc.start()
+            ms, traverse_ms, rss_before, rss_after = queue.get()
+            proc.join()
+            file_mb = os.path.getsize(path) / 2**20
+            rows.append({
+                'Format': fmt,
+                'Phase': phase,
+                'ms': ms,
+                'MB/s': file_mb / (ms / 1000),
+                'File (MB)': file_mb,
+                'Traverse (ms)': traverse_ms,
+                # For saves the list itself is already built, so this is the extra peak
+                'Peak RSS (MB)': rss_after,
+                'Added RSS (MB)': rss_after - rss_before,
+            })
+    finally:
+        shutil.rmtree(directory)
+    return rows
+
+
+BENCHMARKS = {
+    'tail_append': bench_tail_append,
+    'node_memory': bench_node_memory,
+    'array_backend': bench_array_backend,
+    'bulk_build': bench_bulk_build,
+    'value_index': bench_value_index,
+    'finger': bench_finger,
+    'skip_list_access': bench_skip_list_access,
+    'skip_list_map': bench_skip_list_map,
+    'unrolled_block_size': bench_unrolled_block_size,
+    'self_organizing': bench_self_organizing,
+    'node_pool': bench_node_pool,
+    'pickle_copy_free': bench_pickle_copy_free,
+    'weak_prev': bench_weak_prev,
+    'bulk_gc': bench_bulk_gc,
+    'persistent_versions': bench_persistent_versions,
+    'sort': bench_sort,
+    'splice': bench_splice,
+    'cursor': bench_cursor,
+    'remove_all': bench_remove_all,
+    'deque': bench_deque,
+    'typed_numeric': bench_typed_numeric,
+    'aggregate_crossover': bench_aggregate_crossover,
+    'parallel_scaling': bench_parallel_scaling,
+    'list_storage': bench_list_storage,
+}
+
+
+def main(names=None):
+    for name in names or BENCHMARKS:
+        print_rows(name, BENCHMARKS[name]())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,242 @@
+# Indexable Skip List
+# A positional sequence where every forward pointer records how many positions
+# it skips, giving O(log n) expected access, insert and delete by index.
+
+import random
+from bisect import bisect_left
+from itertools import islice
+
+from linked_list_classes import _SequenceMixin
+
+class SkipListNode:
+    """Skip list tower: per-level next/prev pointers and the width of each next link"""
+    __slots__ = ('data', 'next', 'prev', 'width')
+
+    def __init__(self, data, height):
+        self.data = data
+        self.next = [None] * height
+        self.prev = [None] * height
+        self.width = [1] * height
+
+class IndexableSkipList(_SequenceMixin):
+    """Indexable skip list with the same method names as SinglyLinkedList.
+
+    Positions are ranks: the header sits at rank 0 and element i at rank i + 1.
+    width[level] on a node is the rank distance to next[level]; links to None
+    measure the distance to the virtual end at rank size + 1. A value index
+    (values must be hashable) makes search and delete_by_value O(log n) too.
+    """
+    def __init__(self, max_level=32, p=0.5, seed=None):
+        self.max_level = max_level
+        self.p = p
+        self.level = 1
+        self.header = SkipListNode(None, max_level)
+        self.size = 0
+        self._random = random.Random(seed)
+        self._index = {}
+
+    def _random_height(self):
+        height = 1
+        while height < self.max_level and self._random.random() < self.p:
+            height += 1
+        return height
+
+    def _index_add(self, node, rank):
+        """Index a node just linked at rank; duplicates are kept in a list in rank order"""
+        entry = self._index.get(node.data)
+        if entry is None:
+            self._index[node.data] = node
+            return
+        if type(entry) is not list:
+            entry = self._index[node.data] = [entry]
+        # Binary search costs O(log k) rank climbs of O(log n) each
+        entry.insert(bisect_left(entry, rank, key=self._rank), node)
+
+    def _index_discard(self, node, rank):
+        """Drop a node that is still linked at rank from the index"""
+        entry = self._index[node.data]
+        if entry is node:
+            del self._index[node.data]
+        else:
+            del entry[bisect_left(entry, rank, key=self._rank)]
+            if len(entry) == 1:
+                self._index[node.data] = entry[0]
+
+    def _predecessors(self, rank):
+        """Per-level last node with rank < rank, and that node's rank"""
+        update = [None] * self.level
+        ranks = [0] * self.level
+        x = self.header
+        pos = 0
+        for level in range(self.level - 1, -1, -1):
+            while x.next[level] is not None and pos + x.width[level] < rank:
+                pos += x.width[level]
+                x = x.next[level]
+            update[level] = x
+            ranks[level] = pos
+        return update, ranks
+
+    def _rank(self, node):
+        """Rank of a linked node, found by climbing back towards the header"""
+        rank = 0
+        x = node
+        while x is not self.header:
+            top = len(x.next) - 1
+            x = x.prev[top]
+            rank += x.width[top]
+        return rank
+
+    def _node_at(self, index):
+        target = index + 1
+        x = self.header
+        pos = 0
+        for level in range(self.level - 1, -1, -1):
+            while x.next[level] is not None and pos + x.width[level] <= target:
+                pos += x.width[level]
+                x = x.next[level]
+            if pos == target:
+                break
+        return x
+
+    def get(self, index):
+        """Return the value at index (negative indexes count from the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("skip list index out of range")
+        return self._node_at(index).data
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        height = self._random_height()
+        header = self.header
+        for level in range(self.level, height):
+            # Newly used header levels point straight at the end
+            header.next[level] = None
+            header.width[level] = self.size + 1
+        self.level = max(self.level, height)
+        update, ranks = self._predecessors(index + 1)
+        node = SkipListNode(data, height)
+        for level in range(height):
+            pred = update[level]
+            successor = pred.next[level]
+            node.next[level] = successor
+            node.prev[level] = pred
+            if successor is not None:
+                successor.prev[level] = node
+            pred.next[level] = node
+            node.width[level] = ranks[level] + pred.width[level] - index
+            pred.width[level] = index + 1 - ranks[level]
+        for level in range(height, self.level):
+            update[level].width[level] += 1
+        self._index_add(node, index + 1)
+        self.size += 1
+        return True
+
+    def insert_at_beginning(self, data):
+        self.insert_at_index(data, 0)
+
+    def insert_at_end(self, data):
+        self.insert_at_index(data, self.size)
+
+    def extend(self, values):
+        for data in values:
+            self.insert_at_index(data, self.size)
+
+    def extend_left(self, values):
+        """Prepend values as a block, keeping their order"""
+        self.insert_many_at_index(values, 0)
+
+    def insert_many_at_index(self, values, index):
+        if index < 0 or index > self.size:
+            return False
+        for offset, data in enumerate(values):
+            self.insert_at_index(data, index + offset)
+        return True
+
+    def delete_at_index(self, index):
+        if index < 0 or index >= self.size:
+            return None
+        update, _ = self._predecessors(index + 1)
+        node = update[0].next[0]
+        self._index_discard(node, index + 1)
+        for level in range(self.level):
+            pred = update[level]
+            if pred.next[level] is node:
+                successor = node.next[level]
+                pred.width[level] += node.width[level] - 1
+                pred.next[level] = successor
+                if successor is not None:
+                    successor.prev[level] = pred
+            else:
+                pred.width[level] -= 1
+        while self.level > 1 and self.header.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return node.data
+
+    def delete_from_beginning(self):
+        return self.delete_at_index(0)
+
+    def delete_from_end(self):
+        return self.delete_at_index(self.size - 1)
+
+    def _find_node(self, value):
+        """First node holding value, in O(1) from the index"""
+        entry = self._index.get(value)
+        if type(entry) is list:
+            return entry[0]
+        return entry
+
+    def search(self, value):
+        node = self._find_node(value)
+        return -1 if node is None else self._rank(node) - 1
+
+    def delete_by_value(self, value):
+        node = self._find_node(value)
+        if node is None:
+            return False
+        self.delete_at_index(self._rank(node) - 1)
+        return True
+
+    def __iter__(self):
+        current = self.header.next[0]
+        while current is not None:
+            yield current.data
+            current = current.next[0]
+
+    def __reversed__(self):
+        if self.size == 0:
+            return
+        current = self._node_at(self.size - 1)
+        while current is not self.header:
+            yield current.data
+            current = current.prev[0]
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return value in self._index
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def islice(self, start=0, stop=None, step=1):
+        """Lazily yield elements start..stop, jumping to start in O(log n)"""
+        if start < 0:
+            raise ValueError("start must be a non-negative index")
+        if start >= self.size:
+            return iter(())
+        current = self._node_at(start)
+
+        def values():
+            node = current
+            while node is not None:
+                yield node.data
+                node = node.next[0]
+        return islice(values(), 0, None if stop is None else max(0, stop - start), step)
+
+    def traverse(self):
+        return list(self)
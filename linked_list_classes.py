@@ -1,6 +1,13 @@
 # Linked List Classes
 # Extracted linked list implementations for better code organization
 
+import gc
+import time
+import weakref
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from operator import index as operator_index, length_hint
+
 class Node:
     """Basic node class for linked lists"""
     def __init__(self, data):
@@ -8,27 +15,965 @@ class Node:
         self.next = None
         self.prev = None  # For doubly linked list
 
-class SinglyLinkedList:
-    """Singly linked list implementation"""
-    def __init__(self):
+class SinglyNode:
+    """Compact node with only a forward pointer (singly and circular lists)"""
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DoublyNode:
+    """Compact node with forward and backward pointers (doubly linked list)"""
+    __slots__ = ('data', 'next', 'prev')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+class WeakDoublyNode:
+    """DoublyNode whose prev is held through a weak reference.
+
+    Only next links keep nodes alive, so a chain has no reference cycles and is
+    freed by reference counting as soon as the list is dropped.
+    """
+    __slots__ = ('data', 'next', '_prev', '__weakref__')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self._prev = None
+
+    @property
+    def prev(self):
+        ref = self._prev
+        return None if ref is None else ref()
+
+    @prev.setter
+    def prev(self, node):
+        # weakref.ref reuses a node's existing callback-free reference
+        self._prev = None if node is None else weakref.ref(node)
+
+class NodePool:
+    """Bounded free list of detached nodes that lists can share to recycle allocations.
+
+    Released nodes are cleared and chained through their next pointer; acquire
+    pops from that chain before falling back to allocating a new node_class.
+    Nodes handed out by find() must not be used after they are deleted.
+    """
+    def __init__(self, node_class=SinglyNode, capacity=1024):
+        self.node_class = node_class
+        self.capacity = capacity
+        self._free = None
+        self._clears_prev = hasattr(node_class, 'prev') or not hasattr(node_class, '__slots__')
+        self.free_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def acquire(self, data):
+        node = self._free
+        if node is None:
+            self.misses += 1
+            return self.node_class(data)
+        self._free = node.next
+        self.free_count -= 1
+        self.hits += 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node):
+        if self.free_count >= self.capacity:
+            self.discarded += 1
+            return
+        node.data = None
+        if self._clears_prev:
+            node.prev = None
+        node.next = self._free
+        self._free = node
+        self.free_count += 1
+
+    def clear(self):
+        self._free = None
+        self.free_count = 0
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            'free': self.free_count,
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / requests if requests else 0.0,
+            'discarded': self.discarded,
+        }
+
+@contextmanager
+def bulk_build(thresholds=None, freeze=False):
+    """Keep the cyclic GC out of the way while linking many nodes.
+
+    Collection is disabled for the block, or retuned to thresholds (a
+    gc.set_threshold tuple) if given, and the previous settings are restored
+    afterwards. freeze=True moves everything alive at the end of the block,
+    including the finished list, into the permanent generation so later
+    collections skip it. Yields a dict that is filled in on exit with the
+    elapsed time and the collections that still ran inside the block.
+    """
+    report = {'elapsed_ms': 0.0, 'gc_ms': 0.0, 'collections': 0, 'collected': 0, 'frozen': 0}
+    started = []
+
+    def on_collect(phase, info):
+        if phase == 'start':
+            started.append(time.perf_counter())
+        elif started:
+            report['gc_ms'] += (time.perf_counter() - started.pop()) * 1000
+            report['collections'] += 1
+            report['collected'] += info['collected']
+
+    was_enabled = gc.isenabled()
+    old_thresholds = gc.get_threshold()
+    if thresholds is None:
+        gc.disable()
+    else:
+        gc.set_threshold(*thresholds)
+    gc.callbacks.append(on_collect)
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        gc.callbacks.remove(on_collect)
+        gc.set_threshold(*old_thresholds)
+        if was_enabled:
+            gc.enable()
+        if freeze:
+            gc.freeze()
+            report['frozen'] = gc.get_freeze_count()
+        report['elapsed_ms'] = (time.perf_counter() - start) * 1000
+
+class Cursor:
+    """Position in a linked list for O(1) local edits.
+
+    A cursor sits on a node, or past the end (node None) once it moves beyond
+    the last one. Edits made through it keep it valid; any other structural
+    change to the list makes it stale, and using it then raises RuntimeError.
+    On singly linked lists the predecessor is tracked while moving forward, so
+    insert_before and remove stay O(1); only move_prev has to walk.
+    """
+    __slots__ = ('_list', '_node', '_prev', '_index', '_version', '_removed')
+
+    def __init__(self, ll, node, prev=None, index=None):
+        self._list = ll
+        self._node = node
+        self._prev = prev
+        # None until resolved: the position (and, singly, the predecessor) is unknown
+        self._index = index
+        self._version = ll._version
+        # Set by remove(), which already leaves the cursor on the following node
+        self._removed = False
+
+    def _check(self):
+        if self._version != self._list._version:
+            raise RuntimeError("stale cursor: the list was modified since the cursor was created")
+
+    def _locate(self):
+        """Resolve the index and predecessor by walking from head (O(n))"""
+        ll = self._list
+        prev, node = None, ll.head
+        for index in range(ll.size):
+            if node is self._node:
+                break
+            prev, node = node, node.next
+        else:
+            index = ll.size
+        self._prev = prev
+        self._index = index
+
+    def _predecessor(self):
+        ll = self._list
+        if ll.has_prev:
+            return ll.tail if self._node is None else self._node.prev
+        if self._index is None:
+            self._locate()
+        return self._prev
+
+    def _sync(self):
+        self._version = self._list._version
+        self._removed = False
+
+    @property
+    def valid(self):
+        return self._version == self._list._version
+
+    @property
+    def at_end(self):
+        self._check()
+        return self._node is None
+
+    @property
+    def index(self):
+        self._check()
+        if self._index is None:
+            self._locate()
+        return self._index
+
+    @property
+    def value(self):
+        self._check()
+        if self._node is None:
+            raise IndexError("cursor is past the end")
+        return self._node.data
+
+    @value.setter
+    def value(self, data):
+        self._check()
+        node = self._node
+        if node is None:
+            raise IndexError("cursor is past the end")
+        index = self._list._index
+        if index is not None:
+            self._list._index_discard(node)
+        node.data = data
+        if index is not None:
+            self._list._index_add(node)
+
+    def move_next(self):
+        """Step forward; False once past the end (circular lists wrap to head)"""
+        self._check()
+        self._removed = False
+        ll = self._list
+        node = self._node
+        if node is None:
+            return False
+        if node is ll.tail:
+            if ll.circular:
+                self._node, self._prev, self._index = ll.head, None, 0
+                return True
+            self._node, self._prev = None, node
+            if self._index is not None:
+                self._index += 1
+            return False
+        self._node, self._prev = node.next, node
+        if self._index is not None:
+            self._index += 1
+        return True
+
+    def move_prev(self):
+        """Step back (O(1) on doubly linked lists); False at head (circular lists wrap to tail)"""
+        self._check()
+        self._removed = False
+        ll = self._list
+        prev = self._predecessor()
+        if prev is None:
+            if not ll.circular or ll.size == 0:
+                return False
+            self._node, self._index = ll.tail, ll.size - 1
+            self._prev = None if ll.has_prev else (ll._node_at(ll.size - 2) if ll.size > 1 else None)
+            return True
+        if self._index is None:
+            self._locate()
+        self._index -= 1
+        self._node = prev
+        if not ll.has_prev:
+            self._prev = ll._node_at(self._index - 1) if self._index else None
+        return True
+
+    def insert_after(self, data):
+        """Insert data after the cursor's node; the cursor stays where it is"""
+        self._check()
+        ll = self._list
+        node = self._node
+        if node is None:
+            raise IndexError("cannot insert after the end")
+        ll._room()
+        following = None if node is ll.tail else node.next
+        index = None if self._index is None else self._index + 1
+        ll._link_between(node, following, ll._new_node(data), index)
+        self._sync()
+
+    def insert_before(self, data):
+        """Insert data in front of the cursor's node (past the end: append); the cursor stays on its node"""
+        self._check()
+        ll = self._list
+        ll._room()
+        prev = self._predecessor()
+        new_node = ll._new_node(data)
+        ll._link_between(prev, self._node, new_node, self._index)
+        self._prev = new_node
+        if self._index is not None:
+            self._index += 1
+        self._sync()
+
+    def remove(self):
+        """Unlink the cursor's node and return its value; the cursor moves to the following node"""
+        self._check()
+        ll = self._list
+        node = self._node
+        if node is None:
+            raise IndexError("cursor is past the end")
+        prev = self._predecessor()
+        following = None if node is ll.tail else node.next
+        deleted_data = node.data
+        ll._unlink_between(prev, node, self._index)
+        self._node = following
+        self._sync()
+        self._removed = True
+        return deleted_data
+
+def _run_end(prev, key, reverse):
+    """Last node of the ascending (descending if reverse) run after prev.
+
+    A strictly descending run is reversed in place first, which is still
+    stable and turns reversed input into a single run.
+    """
+    node = prev.next
+    current = node.data if key is None else key(node.data)
+    if node.next is None:
+        return node
+    following = node.next.data if key is None else key(node.next.data)
+    if (current < following) if reverse else (following < current):
+        end = node.next
+        current = following
+        while end.next is not None:
+            following = end.next.data if key is None else key(end.next.data)
+            if not ((current < following) if reverse else (following < current)):
+                break
+            end = end.next
+            current = following
+        rest = end.next
+        back, forward = rest, node
+        while forward is not rest:
+            forward.next, back, forward = back, forward, forward.next
+        prev.next = end
+        return node
+    while node.next is not None:
+        following = node.next.data if key is None else key(node.next.data)
+        if (current < following) if reverse else (following < current):
+            break
+        node = node.next
+        current = following
+    return node
+
+def _merge_adjacent_runs(prev, a_end, b_end, key, reverse):
+    """Merge the runs prev.next..a_end and a_end.next..b_end in place.
+
+    Right-run nodes are spliced in front of the left-run node they sort before,
+    only when strictly smaller, which keeps the merge stable. Every comparison
+    happens before the pointer writes of a splice, so the chain stays whole if
+    one raises. Returns the last node of the merged run.
+    """
+    rest = b_end.next
+    x = prev.next
+    y = a_end.next
+    kx = x.data if key is None else key(x.data)
+    ky = y.data if key is None else key(y.data)
+    while True:
+        if (kx < ky) if reverse else (ky < kx):
+            following = y.next
+            a_end.next = following
+            y.next = x
+            prev.next = y
+            prev = y
+            y = following
+            if y is rest:
+                return a_end
+            ky = y.data if key is None else key(y.data)
+        else:
+            prev = x
+            x = x.next
+            if x is y:
+                # Left run used up; the rest of the right run is already in place
+                return b_end
+            kx = x.data if key is None else key(x.data)
+
+class _SequenceMixin:
+    """Construction, slicing, paging and repr shared by the list-like classes.
+
+    Classes provide __iter__, size and (for from_iterable) extend(); they
+    override islice or page when they can do better than a walk from the head.
+    """
+    __slots__ = ()
+    repr_limit = 10
+
+    @classmethod
+    def from_iterable(cls, values, **options):
+        """Build a new list from any iterable in a single linking pass"""
+        ll = cls(**options)
+        ll.extend(values)
+        return ll
+
+    def _repr_fields(self):
+        return f"size={self.size}"
+
+    def __repr__(self):
+        shown = ', '.join(repr(value) for value in self.islice(0, self.repr_limit))
+        more = ', ...' if self.size > self.repr_limit else ''
+        return f"{type(self).__name__}([{shown}{more}], {self._repr_fields()})"
+
+    def islice(self, start=0, stop=None, step=1):
+        """Lazily yield elements start..stop (like itertools.islice) without copying the list"""
+        return islice(self, start, stop, step)
+
+    def page(self, number, page_size=20):
+        """Return the values on page `number` (0-based) of size page_size"""
+        return list(self.islice(number * page_size, (number + 1) * page_size))
+
+class _LinkedListBase(_SequenceMixin):
+    """Behaviour shared by the linked list classes.
+
+    Subclasses provide node_class, _nodes() and the usual insert/delete/search
+    methods. Every node is created through _new_node and retired through
+    _drop_node so optional bookkeeping (the value index, the node pool) stays
+    in sync.
+    """
+    node_class = SinglyNode
+    has_prev = False
+    circular = False
+    _maxlen = None
+    # Bulk paths link inside bulk_build() once a batch reaches this many values
+    bulk_gc_threshold = 10000
+
+    def __init__(self, *, indexed=False, pool=None):
+        if pool is not None and pool.node_class is not self.node_class:
+            raise ValueError(f"{type(self).__name__} needs a pool of {self.node_class.__name__}")
         self.head = None
+        self.tail = None
         self.size = 0
+        # Optional value index: value -> node, or value -> {node: None} once a
+        # value is duplicated, with the duplicates kept in list order
+        self._index = {} if indexed else None
+        # Duplicated values whose dicts may be out of list order (None: all of them)
+        self._index_unordered = set()
+        # Last (index, node) reached by a positional walk, reused as a starting point
+        self._finger = None
+        self._pool = pool
+        # Bumped by every structural change so cursors can detect they are stale
+        self._version = 0
+
+    def _build_chain(self, values, edge=None):
+        """_link_chain, with the GC suspended for large batches"""
+        if length_hint(values) >= self.bulk_gc_threshold:
+            with bulk_build():
+                return self._link_chain(values, edge)
+        # Unsized iterables (generators, map objects) report no length up front:
+        # suspend the GC once the batch actually reaches the threshold
+        with ExitStack() as stack:
+            return self._link_chain(self._bulk_after_threshold(values, stack), edge)
+
+    def _bulk_after_threshold(self, values, stack):
+        """Yield values, entering bulk_build() on stack after the first bulk_gc_threshold"""
+        values = iter(values)
+        count = 0
+        for data in islice(values, self.bulk_gc_threshold):
+            yield data
+            count += 1
+        if count < self.bulk_gc_threshold:
+            return
+        stack.enter_context(bulk_build())
+        yield from values
+
+    def _new_node(self, data, edge=None):
+        """New node for data; edge is 'head' or 'tail' when it will be linked at that end"""
+        self._version += 1
+        if self._pool is None:
+            node = self.node_class(data)
+        else:
+            node = self._pool.acquire(data)
+        if self._index is not None:
+            self._index_add(node, edge)
+        return node
+
+    def _drop_node(self, node):
+        """Retire a node that is already unlinked; its fields may be cleared"""
+        self._version += 1
+        if self._index is not None:
+            self._index_discard(node)
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _index_add(self, node, edge=None):
+        entry = self._index.get(node.data)
+        if entry is None:
+            self._index[node.data] = node
+            return
+        if type(entry) is not dict:
+            entry = {entry: None}
+        if edge == 'head':
+            # Rebuilt with the new node first, O(number of duplicates)
+            self._index[node.data] = {node: None, **entry}
+            return
+        entry[node] = None
+        self._index[node.data] = entry
+        # A duplicate linked anywhere but the tail may belong before the others
+        if edge != 'tail' and self._index_unordered is not None:
+            self._index_unordered.add(node.data)
+
+    def _index_discard(self, node):
+        entry = self._index[node.data]
+        if entry is node:
+            del self._index[node.data]
+        else:
+            del entry[node]
+            if len(entry) == 1:
+                self._index[node.data] = next(iter(entry))
+                if self._index_unordered:
+                    self._index_unordered.discard(node.data)
+
+    def _index_reordered(self):
+        """Nodes were moved around: no duplicate dict is known to be in list order"""
+        if self._index is not None:
+            self._index_unordered = None
+
+    def _order_duplicates(self):
+        """Put the stale duplicate dicts back in list order with one walk"""
+        unordered = self._index_unordered
+        buckets = {value: {} for value, entry in self._index.items()
+                   if type(entry) is dict and (unordered is None or value in unordered)}
+        for node in self._nodes():
+            bucket = buckets.get(node.data)
+            if bucket is not None:
+                bucket[node] = None
+        for value, bucket in buckets.items():
+            self._index[value] = bucket
+        self._index_unordered = set()
+
+    @property
+    def indexed(self):
+        return self._index is not None
+
+    def enable_index(self):
+        """Build the value index from the current nodes (O(n)); values must be hashable"""
+        self._index = {}
+        self._index_unordered = set()
+        for node in self._nodes():
+            self._index_add(node, 'tail')
+
+    def disable_index(self):
+        self._index = None
+
+    def _find_node(self, value):
+        """First node (in list order) holding value, or None.
+
+        With the index a duplicated value is O(1) too, except for one walk
+        after edits that may have put a duplicate ahead of the others.
+        """
+        if self._index is not None:
+            entry = self._index.get(value)
+            if entry is None or type(entry) is not dict:
+                return entry
+            unordered = self._index_unordered
+            if unordered is None or value in unordered:
+                self._order_duplicates()
+                entry = self._index[value]
+            return next(iter(entry))
+        current = self.head
+        for i in range(self.size):
+            if current.data == value:
+                return current
+            current = current.next
+        return None
+
+    def _shift_finger(self, index, delta):
+        """Keep the finger valid after delta nodes were inserted/removed at index"""
+        finger = self._finger
+        if finger is not None and finger[0] >= index:
+            if delta < 0 and finger[0] < index - delta:
+                self._finger = None  # The finger node itself was removed
+            else:
+                self._finger = (finger[0] + delta, finger[1])
+
+    def _node_at(self, index):
+        """Node at a valid index, walking forward from head or the finger"""
+        if index == self.size - 1:
+            node = self.tail
+        else:
+            start, node = 0, self.head
+            finger = self._finger
+            if finger is not None and finger[0] <= index:
+                start, node = finger
+            for i in range(index - start):
+                node = node.next
+        self._finger = (index, node)
+        return node
+
+    def get(self, index):
+        """Return the value at index (negative indexes count from the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        return self._node_at(index).data
+
+    def _position_of(self, target):
+        current = self.head
+        for position in range(self.size):
+            if current is target:
+                return position
+            current = current.next
+        return -1
+
+    def find(self, value):
+        """Return the first node holding value, or None (O(1) average when indexed)"""
+        return self._find_node(value)
+
+    def search(self, value):
+        if self._index is not None:
+            node = self._find_node(value)
+            return -1 if node is None else self._position_of(node)
+        current = self.head
+        for position in range(self.size):
+            if current.data == value:
+                return position
+            current = current.next
+        return -1
+
+    def cursor(self, index=0):
+        """Cursor at index (size gives a cursor past the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index <= self.size:
+            raise IndexError("linked list index out of range")
+        if index == 0:
+            return Cursor(self, self.head, None, 0)
+        prev = self._node_at(index - 1)
+        return Cursor(self, prev.next if index < self.size else None, prev, index)
+
+    def find_cursor(self, value):
+        """Cursor on the first node holding value, or None"""
+        if self._index is not None:
+            node = self._find_node(value)
+            return None if node is None else Cursor(self, node)
+        prev, node = None, self.head
+        for index in range(self.size):
+            if node.data == value:
+                return Cursor(self, node, prev, index)
+            prev, node = node, node.next
+        return None
+
+    def cursors(self):
+        """Walk the list with a single Cursor yielded at each node.
+
+        Edits and moves made through the cursor are allowed; the walk carries on
+        after wherever the cursor was left, without wrapping around a circular list.
+        """
+        cursor = Cursor(self, self.head, None, 0)
+        while cursor._node is not None:
+            yield cursor
+            cursor._check()
+            if cursor._removed:
+                # remove() already left the cursor on the following node
+                cursor._removed = False
+            elif cursor._node is None or cursor._node is self.tail:
+                return
+            else:
+                cursor.move_next()
+
+    def _link_between(self, prev, node, new_node, index=None):
+        """Link new_node between neighbours prev and node (None at either end) in O(1)"""
+        new_node.next = node
+        if prev is None:
+            self.head = new_node
+        else:
+            prev.next = new_node
+        if node is None:
+            self.tail = new_node
+        self.size += 1
+        if index is None:
+            self._finger = None
+        else:
+            self._shift_finger(index, 1)
+
+    def _unlink_between(self, prev, node, index=None):
+        """Unlink node, whose predecessor is prev (None at head), in O(1)"""
+        following = None if node is self.tail else node.next
+        if prev is None:
+            self.head = following
+        else:
+            prev.next = following
+        if following is None:
+            self.tail = prev
+        self._drop_node(node)
+        self.size -= 1
+        if index is None:
+            self._finger = None
+        else:
+            self._shift_finger(index, -1)
+
+    def _adopt_chain(self, first):
+        """Take first..None as the node sequence after the forward links were rearranged"""
+        last = None
+        node = first
+        while node is not None:
+            last = node
+            node = node.next
+        self.head = first
+        self.tail = last
+        self._finger = None
+        self._version += 1
+        self._index_reordered()
+
+    def sort(self, key=None, reverse=False):
+        """Stable in-place merge sort that relinks nodes.
+
+        Bottom-up over natural runs: each pass merges neighbouring ascending
+        runs by splicing nodes of the right run into the left one, until a pass
+        finds a single run. No recursion and O(1) extra space; values keep
+        their nodes, so find() results and the value index stay valid. If a
+        comparison raises, the list is left complete in some partial order.
+        """
+        if self.size < 2:
+            return
+        self.tail.next = None  # Open the ring of a circular list
+        sentinel = SinglyNode(None)
+        sentinel.next = self.head
+        try:
+            merged = True
+            while merged:
+                merged = False
+                prev = sentinel
+                while prev.next is not None:
+                    a_end = _run_end(prev, key, reverse)
+                    if a_end.next is None:
+                        break
+                    b_end = _run_end(a_end, key, reverse)
+                    prev = _merge_adjacent_runs(prev, a_end, b_end, key, reverse)
+                    merged = True
+        finally:
+            self._adopt_chain(sentinel.next)
+
+    def remove_if(self, predicate):
+        """Remove every element for which predicate(value) is true in one pass; return how many.
+
+        Kept nodes are relinked as the walk goes, so if predicate raises the
+        list is left intact with only the elements already visited filtered.
+        """
+        if self.head is None:
+            return 0
+        self.tail.next = None  # Open the ring of a circular list
+        has_prev = self.has_prev
+        first = kept = None
+        removed = 0
+        node = self.head
+        try:
+            while node is not None:
+                following = node.next
+                if predicate(node.data):
+                    self._drop_node(node)
+                    removed += 1
+                else:
+                    if kept is None:
+                        first = node
+                    else:
+                        kept.next = node
+                    if has_prev:
+                        node.prev = kept
+                    kept = node
+                node = following
+        finally:
+            # node is where the walk stopped: None, or the first unvisited node
+            if kept is None:
+                first = node
+            else:
+                kept.next = node
+            if node is None:
+                self.tail = kept
+            elif has_prev:
+                node.prev = kept
+            self.head = first
+            if self.circular and self.tail is not None:
+                self.tail.next = self.head
+            self.size -= removed
+            self._finger = None
+            self._version += 1
+        return removed
+
+    def remove_all(self, value):
+        """Remove every occurrence of value in one pass; return how many were removed"""
+        if self._index is not None and value not in self._index:
+            return 0
+        return self.remove_if(lambda data: data == value)
+
+    def retain(self, predicate):
+        """Keep only the elements for which predicate(value) is true; return how many were removed"""
+        return self.remove_if(lambda data: not predicate(data))
+
+    def dedupe(self):
+        """Drop repeated values, keeping each first occurrence in order; values must be hashable"""
+        seen = set()
+
+        def repeated(data):
+            if data in seen:
+                return True
+            seen.add(data)
+            return False
+        return self.remove_if(repeated)
+
+    def _detach_all(self):
+        """Hand every node over as an open chain (first, last, count), leaving the list empty"""
+        first, last, count = self.head, self.tail, self.size
+        if last is not None:
+            last.next = None  # Open the ring of a circular list
+        self.head = self.tail = None
+        self.size = 0
+        self._finger = None
+        self._version += 1
+        if self._index is not None:
+            self._index = {}
+            self._index_unordered = set()
+        return first, last, count
+
+    def _index_chain(self, first, count, add=True, edge=None):
+        """Add (or discard) count nodes starting at first in the value index"""
+        if self._index is None:
+            return
+        node = first
+        for i in range(count):
+            if add:
+                self._index_add(node, edge)
+            else:
+                self._index_discard(node)
+            node = node.next
+
+    def _take_nodes(self, other, edge=None):
+        if other is self:
+            raise ValueError("cannot move a list's nodes into itself")
+        if not isinstance(other, _LinkedListBase) or other.node_class is not self.node_class:
+            raise ValueError(f"{type(self).__name__} can only take nodes of {self.node_class.__name__}")
+        first, last, count = other._detach_all()
+        self._index_chain(first, count, edge=edge)
+        self._version += 1
+        return first, last, count
+
+    def _room(self, count=1):
+        """Raise IndexError if a positional insert of count values would exceed maxlen"""
+        if self._maxlen is not None and self.size + count > self._maxlen:
+            raise IndexError("list already at its maximum size")
+
+    def _discard_overflow(self, from_left):
+        """Drop values from one end until size is back within maxlen"""
+        if self._maxlen is None:
+            return
+        while self.size > self._maxlen:
+            if from_left:
+                self.delete_from_beginning()
+            else:
+                self.delete_from_end()
+
+    def concat(self, other):
+        """Move all of other's nodes onto the end in O(1); other is left empty.
+
+        other must use the same node class. An indexed list also indexes the
+        moved nodes, which costs O(len(other)).
+        """
+        self._splice_chain(self.size, *self._take_nodes(other, edge='tail'))
+        self._discard_overflow(from_left=True)
+
+    def splice(self, index, other):
+        """Move all of other's nodes in at index (O(1) once the position is reached); other is left empty"""
+        if index < 0 or index > self.size:
+            return False
+        self._room(len(other))
+        self._splice_chain(index, *self._take_nodes(other))
+        return True
+
+    def split_at(self, index):
+        """Cut the list before index and return the nodes from index on as a new list of the same kind"""
+        if index < 0 or index > self.size:
+            return None
+        rest = type(self)(pool=self._pool, **self._options())
+        if index == self.size:
+            return rest
+        if index == 0:
+            first, last, count = self._detach_all()
+        else:
+            before = self._node_at(index - 1)
+            first, last, count = before.next, self.tail, self.size - index
+            last.next = None
+            before.next = None
+            if hasattr(first, 'prev'):
+                first.prev = None
+            self.tail = before
+            self.size = index
+            self._shift_finger(index, -count)
+            self._version += 1
+            self._index_chain(first, count, add=False)
+        rest._index_chain(first, count, edge='tail')
+        rest._splice_chain(0, first, last, count)
+        return rest
+
+    def _options(self):
+        """Constructor options a copy should inherit (the pool is not pickled)"""
+        return {'indexed': self.indexed}
+
+    def __getstate__(self):
+        # A flat value list pickles and deep-copies without recursing per node
+        return {'options': self._options(), 'values': list(self)}
+
+    def __setstate__(self, state):
+        self.__init__(**state['options'])
+        self.extend(state['values'])
+
+    def clone(self):
+        """Iterative copy with fresh nodes sharing the same values (and pool)"""
+        return type(self).from_iterable(self, pool=self._pool, **self._options())
+
+    def clear(self):
+        """Unlink every node iteratively so they are freed without deep recursion or cyclic GC"""
+        node = self.head
+        has_prev = hasattr(node, 'prev')
+        if self.tail is not None:
+            self.tail.next = None  # Open the ring of a circular list
+        while node is not None:
+            successor = node.next
+            node.next = None
+            if has_prev:
+                node.prev = None
+            if self._pool is not None:
+                self._pool.release(node)
+            node = successor
+        if self._index is not None:
+            self._index = {}
+            self._index_unordered = set()
+        self.head = self.tail = None
+        self.size = 0
+        self._finger = None
+        self._version += 1
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        if self._index is not None:
+            return value in self._index
+        return self.search(value) != -1
+
+class SinglyLinkedList(_LinkedListBase):
+    """Singly linked list implementation"""
+    node_class = SinglyNode
+
+    def _nodes(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'head')
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._shift_finger(0, 1)
         self.size += 1
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'tail')
         if self.head is None:
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
     def insert_at_index(self, data, index):
@@ -37,22 +982,77 @@ class SinglyLinkedList:
         if index == 0:
             self.insert_at_beginning(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index - 1):
-            if current is None:
-                return False
-            current = current.next
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        current = self._node_at(index - 1)
+        new_node = self._new_node(data)
         new_node.next = current.next
         current.next = new_node
         self.size += 1
+        self._finger = (index, new_node)
+        return True
+
+    def _link_chain(self, values, edge=None):
+        """Link values into a detached chain in one pass; return (first, last, count)"""
+        new_node = self._new_node
+        first = last = None
+        count = 0
+        for data in values:
+            node = new_node(data, edge)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        return first, last, count
+
+    def _splice_chain(self, index, first, last, count):
+        """Link the detached chain first..last (count nodes) in at a valid index"""
+        if count == 0:
+            return
+        if index == self.size:
+            if self.tail is None:
+                self.head = first
+            else:
+                self.tail.next = first
+            self.tail = last
+            last.next = None
+        elif index == 0:
+            last.next = self.head
+            self.head = first
+            self._shift_finger(0, count)
+        else:
+            current = self._node_at(index - 1)
+            last.next = current.next
+            current.next = first
+            self._shift_finger(index, count)
+        self.size += count
+
+    def extend(self, values):
+        self._splice_chain(self.size, *self._build_chain(values, edge='tail'))
+
+    def extend_left(self, values):
+        """Prepend values as a block, keeping their order"""
+        self._splice_chain(0, *self._build_chain(values))
+
+    def insert_many_at_index(self, values, index):
+        if index < 0 or index > self.size:
+            return False
+        self._splice_chain(index, *self._build_chain(values))
         return True
 
     def delete_from_beginning(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        self.head = self.head.next
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        deleted_data = node.data
+        self._drop_node(node)
+        self._shift_finger(0, -1)
         self.size -= 1
         return deleted_data
 
@@ -60,71 +1060,179 @@ class SinglyLinkedList:
         if self.head is None:
             return None
         if self.head.next is None:
-            deleted_data = self.head.data
-            self.head = None
-            self.size -= 1
-            return deleted_data
-        current = self.head
-        while current.next.next:
-            current = current.next
-        deleted_data = current.next.data
+            return self.delete_from_beginning()
+        node = self.tail
+        current = self._node_at(self.size - 2)
         current.next = None
+        self.tail = current
+        deleted_data = node.data
+        self._drop_node(node)
+        self.size -= 1
+        return deleted_data
+
+    def _remove_node(self, node):
+        """Unlink a known node; without back pointers this walks to its predecessor"""
+        prev = None
+        current = self.head
+        while current is not node:
+            prev, current = current, current.next
+        self._unlink_between(prev, node)
+
+    def delete_at_index(self, index):
+        if index < 0 or index >= self.size:
+            return None
+        if index == 0:
+            return self.delete_from_beginning()
+        current = self._node_at(index - 1)
+        node = current.next
+        current.next = node.next
+        if node is self.tail:
+            self.tail = current
+        deleted_data = node.data
+        self._drop_node(node)
+        self._finger = (index - 1, current)
         self.size -= 1
         return deleted_data
 
     def delete_by_value(self, value):
+        if self._index is not None:
+            node = self._find_node(value)
+            if node is None:
+                return False
+            self._remove_node(node)
+            return True
+        self._finger = None
         if self.head is None:
             return False
         if self.head.data == value:
-            self.head = self.head.next
-            self.size -= 1
+            self.delete_from_beginning()
             return True
         current = self.head
         while current.next and current.next.data != value:
             current = current.next
-        if current.next:
-            current.next = current.next.next
+        node = current.next
+        if node:
+            if node is self.tail:
+                self.tail = current
+            current.next = node.next
+            self._drop_node(node)
             self.size -= 1
             return True
         return False
 
-    def search(self, value):
+    def __iter__(self):
         current = self.head
-        position = 0
         while current:
-            if current.data == value:
-                return position
+            yield current.data
             current = current.next
-            position += 1
-        return -1
+
+    def __reversed__(self):
+        # No back pointers, so reverse iteration has to buffer the values
+        return reversed(list(self))
 
     def traverse(self):
-        elements = []
+        return list(self)
+
+class DoublyLinkedList(_LinkedListBase):
+    """Doubly linked list implementation.
+
+    weak_prev=True builds the list from WeakDoublyNode, so dropping it frees the
+    nodes immediately instead of leaving a prev/next cycle for the cyclic GC.
+
+    It also offers the collections.deque API (construction as
+    DoublyLinkedList(iterable, maxlen), append, appendleft, pop, popleft,
+    extend, extendleft, rotate, indexing). With maxlen set, adding at one end
+    discards from the other like a bounded deque, and positional inserts into
+    a full list raise IndexError like deque.insert.
+    """
+    node_class = DoublyNode
+    has_prev = True
+
+    def __init__(self, iterable=None, maxlen=None, *, indexed=False, pool=None, weak_prev=False):
+        # Positional arguments follow deque(iterable, maxlen); the rest are keyword-only
+        if weak_prev:
+            self.node_class = WeakDoublyNode
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        super().__init__(indexed=indexed, pool=pool)
+        self._maxlen = maxlen
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def weak_prev(self):
+        return self.node_class is WeakDoublyNode
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    def _options(self):
+        return {'indexed': self.indexed, 'weak_prev': self.weak_prev, 'maxlen': self._maxlen}
+
+    def _adopt_chain(self, first):
+        """Take first..None as the node sequence, rebuilding the back pointers"""
+        prev = None
+        node = first
+        while node is not None:
+            node.prev = prev
+            prev = node
+            node = node.next
+        self.head = first
+        self.tail = prev
+        self._finger = None
+        self._version += 1
+        self._index_reordered()
+
+    def _link_between(self, prev, node, new_node, index=None):
+        new_node.prev = prev
+        if node is not None:
+            node.prev = new_node
+        super()._link_between(prev, node, new_node, index)
+
+    def _unlink_between(self, prev, node, index=None):
+        if node.next is not None:
+            node.next.prev = prev
+        super()._unlink_between(prev, node, index)
+
+    def _nodes(self):
         current = self.head
         while current:
-            elements.append(current.data)
+            yield current
             current = current.next
-        return elements
 
-class DoublyLinkedList:
-    """Doubly linked list implementation"""
-    def __init__(self):
-        self.head = None
-        self.tail = None
-        self.size = 0
+    def _node_at(self, index):
+        """Node at a valid index, walking from the nearest of head, tail or the finger"""
+        start, node = 0, self.head
+        if self.size - 1 - index < index:
+            start, node = self.size - 1, self.tail
+        finger = self._finger
+        if finger is not None and abs(finger[0] - index) < abs(start - index):
+            start, node = finger
+        if start <= index:
+            for i in range(index - start):
+                node = node.next
+        else:
+            for i in range(start - index):
+                node = node.prev
+        self._finger = (index, node)
+        return node
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'head')
         if self.head is None:
             self.head = self.tail = new_node
         else:
             new_node.next = self.head
             self.head.prev = new_node
             self.head = new_node
+        self._shift_finger(0, 1)
         self.size += 1
+        if self._maxlen is not None:
+            self._discard_overflow(from_left=False)
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'tail')
         if self.tail is None:
             self.head = self.tail = new_node
         else:
@@ -132,125 +1240,305 @@ class DoublyLinkedList:
             self.tail.next = new_node
             self.tail = new_node
         self.size += 1
+        if self._maxlen is not None:
+            self._discard_overflow(from_left=True)
 
     def insert_at_index(self, data, index):
         if index < 0 or index > self.size:
             return False
+        self._room()
         if index == 0:
             self.insert_at_beginning(data)
             return True
         if index == self.size:
             self.insert_at_end(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index):
-            current = current.next
+        current = self._node_at(index)
+        new_node = self._new_node(data)
         new_node.prev = current.prev
         new_node.next = current
         current.prev.next = new_node
         current.prev = new_node
+        self._shift_finger(index, 1)
         self.size += 1
         return True
 
-    def delete_from_beginning(self):
+    def _link_chain(self, values, edge=None):
+        """Link values into a detached chain in one pass; return (first, last, count)"""
+        new_node = self._new_node
+        first = last = None
+        count = 0
+        for data in values:
+            node = new_node(data, edge)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+                node.prev = last
+            last = node
+            count += 1
+        return first, last, count
+
+    def _splice_chain(self, index, first, last, count):
+        """Link the detached chain first..last (count nodes) in at a valid index"""
+        if count == 0:
+            return
+        if index == self.size:
+            first.prev = self.tail
+            if self.tail is None:
+                self.head = first
+            else:
+                self.tail.next = first
+            self.tail = last
+            last.next = None
+        elif index == 0:
+            first.prev = None
+            last.next = self.head
+            self.head.prev = last
+            self.head = first
+            self._shift_finger(0, count)
+        else:
+            current = self._node_at(index)
+            first.prev = current.prev
+            last.next = current
+            current.prev.next = first
+            current.prev = last
+            self._shift_finger(index, count)
+        self.size += count
+
+    def extend(self, values):
+        self._splice_chain(self.size, *self._build_chain(values, edge='tail'))
+        if self._maxlen is not None:
+            self._discard_overflow(from_left=True)
+
+    def extend_left(self, values):
+        """Prepend values as a block, keeping their order"""
+        self._splice_chain(0, *self._build_chain(values))
+        if self._maxlen is not None:
+            self._discard_overflow(from_left=False)
+
+    def insert_many_at_index(self, values, index):
+        if index < 0 or index > self.size:
+            return False
+        if self._maxlen is not None:
+            values = list(values)
+            self._room(len(values))
+        self._splice_chain(index, *self._build_chain(values))
+        return True
+
+    # collections.deque API
+
+    def append(self, data):
+        self.insert_at_end(data)
+
+    def appendleft(self, data):
+        self.insert_at_beginning(data)
+
+    def pop(self):
+        if self.tail is None:
+            raise IndexError("pop from an empty deque")
+        return self.delete_from_end()
+
+    def popleft(self):
         if self.head is None:
-            return None
-        deleted_data = self.head.data
-        if self.head == self.tail:
-            self.head = self.tail = None
+            raise IndexError("pop from an empty deque")
+        return self.delete_from_beginning()
+
+    def extendleft(self, values):
+        """Append each value on the left in turn, so they end up reversed (deque.extendleft)"""
+        self.extend_left(reversed(list(values)))
+
+    def rotate(self, n=1):
+        """Rotate n steps to the right by relinking the ends, walking from the nearer one"""
+        if self.size < 2:
+            return
+        steps = -n % self.size
+        if steps == 0:
+            return
+        new_head = self._node_at(steps)
+        new_tail = new_head.prev
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        new_tail.next = None
+        new_head.prev = None
+        self.head, self.tail = new_head, new_tail
+        self._finger = None
+        self._version += 1
+        self._index_reordered()
+
+    def count(self, value):
+        return sum(1 for data in self if data == value)
+
+    def remove(self, value):
+        """Remove the first occurrence of value; ValueError if it is missing (deque.remove)"""
+        if not self.delete_by_value(value):
+            raise ValueError(f"{value!r} is not in list")
+
+    def copy(self):
+        return self.clone()
+
+    def __getitem__(self, index):
+        """Value at index, walking from the nearer end (or the finger)"""
+        return self.get(operator_index(index))
+
+    def __setitem__(self, index, data):
+        index = operator_index(index)
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        node = self._node_at(index)
+        if self._index is not None:
+            self._index_discard(node)
+        node.data = data
+        if self._index is not None:
+            self._index_add(node)
+
+    def __delitem__(self, index):
+        index = operator_index(index)
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        self.delete_at_index(index)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def _remove_node(self, node):
+        """Unlink a known node in O(1)"""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
         else:
-            self.head = self.head.next
-            self.head.prev = None
+            self.tail = node.prev
+        self._drop_node(node)
         self.size -= 1
+
+    def delete_from_beginning(self):
+        if self.head is None:
+            return None
+        node = self.head
+        deleted_data = node.data
+        self._remove_node(node)
+        self._shift_finger(0, -1)
         return deleted_data
 
     def delete_from_end(self):
         if self.tail is None:
             return None
-        deleted_data = self.tail.data
-        if self.head == self.tail:
-            self.head = self.tail = None
-        else:
-            self.tail = self.tail.prev
-            self.tail.next = None
-        self.size -= 1
+        node = self.tail
+        deleted_data = node.data
+        self._shift_finger(self.size - 1, -1)
+        self._remove_node(node)
+        return deleted_data
+
+    def delete_at_index(self, index):
+        if index < 0 or index >= self.size:
+            return None
+        node = self._node_at(index)
+        successor = node.next
+        deleted_data = node.data
+        self._remove_node(node)
+        self._finger = (index, successor) if successor else None
         return deleted_data
 
     def delete_by_value(self, value):
+        node = self._find_node(value)
+        if node is None:
+            return False
+        self._finger = None
+        self._remove_node(node)
+        return True
+
+    def __iter__(self):
         current = self.head
         while current:
-            if current.data == value:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-                self.size -= 1
-                return True
+            yield current.data
             current = current.next
-        return False
 
-    def search(self, value):
-        current = self.head
-        position = 0
+    def __reversed__(self):
+        current = self.tail
         while current:
-            if current.data == value:
-                return position
-            current = current.next
-            position += 1
-        return -1
+            yield current.data
+            current = current.prev
 
     def traverse_forward(self):
-        elements = []
-        current = self.head
-        while current:
-            elements.append(current.data)
-            current = current.next
-        return elements
+        return list(self)
 
     def traverse_backward(self):
-        elements = []
-        current = self.tail
-        while current:
-            elements.append(current.data)
-            current = current.prev
-        return elements
+        return list(reversed(self))
 
-class CircularLinkedList:
+class CircularLinkedList(_LinkedListBase):
     """Circular linked list implementation"""
-    def __init__(self):
-        self.head = None
-        self.size = 0
+    node_class = SinglyNode
+    circular = True
+
+    def _adopt_chain(self, first):
+        super()._adopt_chain(first)
+        if self.tail is not None:
+            self.tail.next = self.head
+
+    def _link_between(self, prev, node, new_node, index=None):
+        super()._link_between(prev, node, new_node, index)
+        self.tail.next = self.head
+
+    def _unlink_between(self, prev, node, index=None):
+        super()._unlink_between(prev, node, index)
+        if self.tail is not None:
+            self.tail.next = self.head
+
+    def split_at(self, index):
+        rest = super().split_at(index)
+        if self.tail is not None:
+            self.tail.next = self.head  # Close the ring of the kept part
+        return rest
+
+    def rotate(self, k=1):
+        """Rotate k steps to the right (like deque.rotate) by moving head and tail only"""
+        if self.size < 2:
+            return
+        steps = -k % self.size
+        if steps == 0:
+            return
+        self.tail = self._node_at(steps - 1)
+        self.head = self.tail.next
+        self._finger = None
+        self._version += 1
+        self._index_reordered()
+
+    def _nodes(self):
+        # tail.next is always head, so walks are bounded by size rather than None
+        current = self.head
+        for i in range(self.size):
+            yield current
+            current = current.next
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'head')
         if self.head is None:
             new_node.next = new_node
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
             new_node.next = self.head
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
             self.head = new_node
+        self._shift_finger(0, 1)
         self.size += 1
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self._new_node(data, 'tail')
         if self.head is None:
             new_node.next = new_node
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
             new_node.next = self.head
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
     def insert_at_index(self, data, index):
@@ -259,94 +1547,172 @@ class CircularLinkedList:
         if index == 0:
             self.insert_at_beginning(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index - 1):
-            current = current.next
-            if current == self.head:
-                return False
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        current = self._node_at(index - 1)
+        new_node = self._new_node(data)
         new_node.next = current.next
         current.next = new_node
         self.size += 1
+        self._finger = (index, new_node)
+        return True
+
+    def _link_chain(self, values, edge=None):
+        """Link values into a detached chain in one pass; return (first, last, count)"""
+        new_node = self._new_node
+        first = last = None
+        count = 0
+        for data in values:
+            node = new_node(data, edge)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        return first, last, count
+
+    def _splice_chain(self, index, first, last, count):
+        """Link the detached chain first..last (count nodes) in at a valid index"""
+        if count == 0:
+            return
+        if index == self.size:
+            if self.head is None:
+                self.head = first
+            else:
+                self.tail.next = first
+            last.next = self.head
+            self.tail = last
+        elif index == 0:
+            last.next = self.head
+            self.tail.next = first
+            self.head = first
+            self._shift_finger(0, count)
+        else:
+            current = self._node_at(index - 1)
+            last.next = current.next
+            current.next = first
+            self._shift_finger(index, count)
+        self.size += count
+
+    def extend(self, values):
+        self._splice_chain(self.size, *self._build_chain(values, edge='tail'))
+
+    def extend_left(self, values):
+        """Prepend values as a block, keeping their order"""
+        self._splice_chain(0, *self._build_chain(values))
+
+    def insert_many_at_index(self, values, index):
+        if index < 0 or index > self.size:
+            return False
+        self._splice_chain(index, *self._build_chain(values))
         return True
 
     def delete_from_beginning(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        if self.head.next == self.head:
-            self.head = None
+        node = self.head
+        if node.next == node:
+            self.head = self.tail = None
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = self.head.next
-            self.head = self.head.next
+            self.head = node.next
+            self.tail.next = self.head
+        deleted_data = node.data
+        self._drop_node(node)
+        self._shift_finger(0, -1)
         self.size -= 1
         return deleted_data
 
     def delete_from_end(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
         if self.head.next == self.head:
-            self.head = None
-        else:
-            current = self.head
-            while current.next.next != self.head:
-                current = current.next
-            deleted_data = current.next.data
-            current.next = self.head
+            return self.delete_from_beginning()
+        node = self.tail
+        current = self._node_at(self.size - 2)
+        current.next = self.head
+        self.tail = current
+        deleted_data = node.data
+        self._drop_node(node)
+        self.size -= 1
+        return deleted_data
+
+    def _remove_node(self, node):
+        """Unlink a known node; without back pointers this walks to its predecessor"""
+        prev = None
+        current = self.head
+        while current is not node:
+            prev, current = current, current.next
+        self._unlink_between(prev, node)
+
+    def delete_at_index(self, index):
+        if index < 0 or index >= self.size:
+            return None
+        if index == 0:
+            return self.delete_from_beginning()
+        current = self._node_at(index - 1)
+        node = current.next
+        current.next = node.next
+        if node is self.tail:
+            self.tail = current
+        deleted_data = node.data
+        self._drop_node(node)
+        self._finger = (index - 1, current)
         self.size -= 1
         return deleted_data
 
     def delete_by_value(self, value):
+        if self._index is not None:
+            node = self._find_node(value)
+            if node is None:
+                return False
+            self._remove_node(node)
+            return True
+        self._finger = None
         if self.head is None:
             return False
         if self.head.data == value:
-            if self.head.next == self.head:
-                self.head = None
-            else:
-                current = self.head
-                while current.next != self.head:
-                    current = current.next
-                current.next = self.head.next
-                self.head = self.head.next
-            self.size -= 1
+            self.delete_from_beginning()
             return True
         current = self.head
         while current.next != self.head and current.next.data != value:
             current = current.next
-        if current.next != self.head:
-            current.next = current.next.next
+        node = current.next
+        if node != self.head:
+            if node == self.tail:
+                self.tail = current
+            current.next = node.next
+            self._drop_node(node)
             self.size -= 1
             return True
         return False
 
-    def search(self, value):
-        if self.head is None:
-            return -1
+    def __iter__(self):
+        """Yield each element once, starting at head"""
         current = self.head
-        position = 0
-        while True:
-            if current.data == value:
-                return position
+        for i in range(self.size):
+            yield current.data
             current = current.next
-            position += 1
-            if current == self.head or position >= self.size:
-                break
-        return -1
 
-    def traverse(self, max_elements=None):
-        if self.head is None:
-            return []
-        elements = []
+    def __reversed__(self):
+        # No back pointers, so reverse iteration has to buffer the values
+        return reversed(list(self))
+
+    def cycle(self, max_elements=None):
+        """Yield elements round the circle, wrapping past tail back to head.
+
+        Runs forever when max_elements is None, otherwise stops after
+        max_elements values. Stops early if the list becomes empty.
+        """
         current = self.head
         count = 0
-        while current and (max_elements is None or count < max_elements):
-            elements.append(current.data)
+        while current is not None and self.head is not None:
+            if max_elements is not None and count >= max_elements:
+                return
+            yield current.data
             current = current.next
             count += 1
-            if current == self.head:
-                break
-        return elements
+
+    def traverse(self, max_elements=None):
+        return list(self.islice(0, max_elements))
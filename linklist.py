@@ -13,6 +13,7 @@ import pandas as pd
 import time
 import random
 import math
+import inspect
 
 try:
     from quiz_config import QUIZ_QUESTIONS
@@ -161,6 +162,11 @@ if 'QUIZ_QUESTIONS' not in locals():
 
 try:
     from linked_list_classes import Node, SinglyLinkedList, DoublyLinkedList, CircularLinkedList
+    from indexable_skip_list import IndexableSkipList
+    import skip_list as skip_list_module
+    import unrolled_linked_list as unrolled_list_module
+    import self_organizing_list as self_organizing_module
+    import persistent_linked_list as persistent_list_module
 except ImportError:
     st.error("⚠️ linked_list_classes.py not found. Please ensure all files are in the same directory.")
     st.stop()
@@ -3287,11 +3293,10 @@ def interactive_playground():
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button("🎲 Random Data", key="random_data"):
-            if hasattr(st.session_state, 'linked_list') and st.session_state.linked_list:
+            if getattr(st.session_state, 'linked_list', None) is not None:
                 import random
                 random_values = [random.randint(1, 100) for _ in range(3)]
-                for val in random_values:
-                    st.session_state.linked_list.insert_at_end(val)
+                st.session_state.linked_list.extend(random_values)
                 st.success(f"🎲 Added: {random_values}")
                 st.rerun()
             else:
@@ -3313,7 +3318,7 @@ def interactive_playground():
 
     # List type selector
     st.header("Select Linked List Type")
-    list_types = ["Singly Linked List", "Doubly Linked List", "Circular Linked List"]
+    list_types = ["Singly Linked List", "Doubly Linked List", "Circular Linked List", "Indexable Skip List"]
     selected_type = st.selectbox("Choose list type:", list_types, index=list_types.index(st.session_state.list_type))
 
     if selected_type != st.session_state.list_type:
@@ -3321,9 +3326,11 @@ def interactive_playground():
         if selected_type == "Singly Linked List":
             st.session_state.linked_list = SinglyLinkedList()
         elif selected_type == "Doubly Linked List":
-            st.session_state.linked_list = DoublyLinkedList()
+            st.session_state.linked_list = DoublyLinkedList(weak_prev=True)
         elif selected_type == "Circular Linked List":
             st.session_state.linked_list = CircularLinkedList()
+        elif selected_type == "Indexable Skip List":
+            st.session_state.linked_list = IndexableSkipList()
         st.rerun()
 
     st.header("Create Your Linked List")
@@ -3334,17 +3341,13 @@ def interactive_playground():
             if user_input:
                 values = [x.strip() for x in user_input.split(",") if x.strip()]
                 if st.session_state.list_type == "Singly Linked List":
-                    st.session_state.linked_list = SinglyLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = SinglyLinkedList.from_iterable(values)
                 elif st.session_state.list_type == "Doubly Linked List":
-                    st.session_state.linked_list = DoublyLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = DoublyLinkedList.from_iterable(values, weak_prev=True)
                 elif st.session_state.list_type == "Circular Linked List":
-                    st.session_state.linked_list = CircularLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = CircularLinkedList.from_iterable(values)
+                elif st.session_state.list_type == "Indexable Skip List":
+                    st.session_state.linked_list = IndexableSkipList.from_iterable(values)
                 st.success(f"{st.session_state.list_type} created with {len(values)} elements!")
             else:
                 st.warning("Please enter some values.")
@@ -3353,29 +3356,28 @@ def interactive_playground():
             if st.session_state.list_type == "Singly Linked List":
                 st.session_state.linked_list = SinglyLinkedList()
             elif st.session_state.list_type == "Doubly Linked List":
-                st.session_state.linked_list = DoublyLinkedList()
+                st.session_state.linked_list = DoublyLinkedList(weak_prev=True)
             elif st.session_state.list_type == "Circular Linked List":
                 st.session_state.linked_list = CircularLinkedList()
+            elif st.session_state.list_type == "Indexable Skip List":
+                st.session_state.linked_list = IndexableSkipList()
             st.info(f"{st.session_state.list_type} cleared!")
 
     st.header(f"Current {st.session_state.list_type}")
     if st.session_state.linked_list.size > 0:
+        # Walk the list once and reuse the values for the text and the plot
+        if st.session_state.list_type == "Circular Linked List":
+            elements = list(st.session_state.linked_list.islice(0, 20))
+        else:
+            elements = list(st.session_state.linked_list)
         if st.session_state.list_type == "Doubly Linked List":
-            st.write("Forward: ", st.session_state.linked_list.traverse_forward())
-            st.write("Backward: ", st.session_state.linked_list.traverse_backward())
+            st.write("Forward: ", elements)
+            st.write("Backward: ", elements[::-1])
         else:
-            elements = st.session_state.linked_list.traverse() if st.session_state.list_type != "Circular Linked List" else st.session_state.linked_list.traverse(20)
             st.write("Elements: ", elements)
-        st.write(f"Length: {st.session_state.linked_list.size}")
+        st.write(f"Length: {len(st.session_state.linked_list)}")
 
         # Enhanced Plotly visualization
-        elements = []
-        if st.session_state.list_type == "Doubly Linked List":
-            elements = st.session_state.linked_list.traverse_forward()
-        elif st.session_state.list_type == "Circular Linked List":
-            elements = st.session_state.linked_list.traverse(20)
-        else:
-            elements = st.session_state.linked_list.traverse()
 
         # Create interactive Plotly visualization
         fig = go.Figure()
@@ -5527,88 +5529,74 @@ def specialized_linked_lists():
     **Skip Lists** are probabilistic data structures that allow O(log n) search time.
     """)
     
-    st.code("""
-class SkipListNode:
-    def __init__(self, key, value, level):
-        self.key = key
-        self.value = value
-        self.forward = [None] * (level + 1)
-
-class SkipList:
-    def __init__(self, max_level=16, p=0.5):
-        self.max_level = max_level
-        self.p = p
-        self.level = 0
-        self.header = SkipListNode(-1, None, max_level)
-    
-    def search(self, key):
-        current = self.header
-        for i in range(self.level, -1, -1):
-            while (current.forward[i] and 
-                   current.forward[i].key < key):
-                current = current.forward[i]
-        current = current.forward[0]
-        if current and current.key == key:
-            return current.value
-        return None
-    """, language="python")
+    st.code(inspect.getsource(skip_list_module), language="python")
+
+    demo_keys = st.text_input("Keys to insert (comma-separated integers)", "42, 7, 19, 3, 88, 56", key="skip_list_keys")
+    col1, col2 = st.columns(2)
+    with col1:
+        range_lo = st.number_input("Range from (inclusive)", value=5, key="skip_list_lo")
+    with col2:
+        range_hi = st.number_input("Range to (exclusive)", value=60, key="skip_list_hi")
+    try:
+        keys = [int(k) for k in demo_keys.split(",") if k.strip()]
+    except ValueError:
+        st.warning("Please enter integer keys.")
+        keys = []
+    demo = skip_list_module.SkipList(seed=0)
+    for k in keys:
+        demo.insert(k, f"value-{k}")
+    st.write("Ordered keys:", list(demo))
+    st.write(f"range({range_lo}, {range_hi}):", list(demo.range(range_lo, range_hi)))
+    st.write(f"Levels in use: {demo.level} (max_level={demo.max_level}, p={demo.p})")
     
     st.header("2. Self-Organizing Lists")
     st.markdown("""
     **Self-Organizing Lists** automatically rearrange elements based on access patterns.
     """)
     
-    st.code("""
-class SelfOrganizingList:
-    def __init__(self, strategy='mtf'):
-        self.head = None
-        self.strategy = strategy
-    
-    def search(self, key):
-        if self.head and self.head.data == key:
-            return self.head
-        
-        prev = self.head
-        current = self.head.next if self.head else None
-        
-        while current:
-            if current.data == key:
-                if self.strategy == 'mtf':  # Move to front
-                    prev.next = current.next
-                    current.next = self.head
-                    self.head = current
-                return current
-            prev = current
-            current = current.next
-        return None
-    """, language="python")
+    st.code(inspect.getsource(self_organizing_module), language="python")
+
+    strategy = st.selectbox("Strategy", list(self_organizing_module.STRATEGIES), index=1, key="self_organizing_strategy")
+    skew = st.radio("Access pattern", ["Zipf", "Uniform"], horizontal=True, key="self_organizing_skew")
+    demo = self_organizing_module.SelfOrganizingList.from_iterable(range(1, 21), strategy=strategy)
+    if skew == "Zipf":
+        workload = self_organizing_module.zipf_workload(range(1, 21), 200, seed=0)
+    else:
+        workload = self_organizing_module.uniform_workload(range(1, 21), 200, seed=0)
+    for key in workload:
+        demo.access(key)
+    st.write("List after 200 lookups:", demo.traverse())
+    st.write("Stats:", demo.stats())
     
     st.header("3. Unrolled Linked Lists")
     st.markdown("""
     **Unrolled Linked Lists** store multiple elements in each node for better cache performance.
     """)
     
-    st.code("""
-class UnrolledNode:
-    def __init__(self, max_size=4):
-        self.max_size = max_size
-        self.elements = []
-        self.next = None
+    st.code(inspect.getsource(unrolled_list_module), language="python")
 
-class UnrolledLinkedList:
-    def __init__(self, max_node_size=4):
-        self.head = None
-        self.max_node_size = max_node_size
-    
-    def insert(self, index, value):
-        # Find appropriate node and insert
-        current = self.head
-        if not current or len(current.elements) < self.max_node_size:
-            if not current:
-                self.head = UnrolledNode(self.max_node_size)
-                current = self.head
-            current.elements.append(value)
-    """, language="python")
+    block_size = st.select_slider("Block size", options=[4, 8, 16, 32, 64], value=4, key="unrolled_block_size")
+    demo = unrolled_list_module.UnrolledLinkedList.from_iterable(range(1, 21), block_size=block_size)
+    demo.insert_at_index(99, 5)
+    demo.delete_at_index(12)
+    st.write("Blocks:", [list(block.elements) for block in demo._blocks()])
+    st.write("Stats:", demo.stats())
+
+    st.header("4. Persistent Linked Lists")
+    st.markdown("""
+    **Persistent Linked Lists** never change in place: every update returns a new version that shares the unchanged suffix with the old one, so undo history costs only the nodes each edit copied.
+    """)
+
+    st.code(inspect.getsource(persistent_list_module), language="python")
+
+    history = persistent_list_module.VersionHistory(persistent_list_module.PersistentLinkedList.from_iterable([1, 2, 3, 4, 5]))
+    history.apply('cons', 0)
+    history.apply('insert_at_index', 99, 3)
+    history.apply('delete_at_index', 1)
+    version = st.slider("Version", 0, len(history) - 1, len(history) - 1, key="persistent_version")
+    shown = history.checkout(version)
+    st.write(f"Version {version}:", shown.traverse())
+    st.write(f"Nodes shared with the latest version: {shown.shared_nodes(history.current)} of {len(shown)}")
 
 def real_world_optimizations():
     st.title("🚀 Real-World Optimizations")
@@ -5632,6 +5620,10 @@ class OptimizedNode:
 # Use collections.deque for better performance
 from collections import deque
 fast_list = deque()  # O(1) operations at both ends
+
+# DoublyLinkedList offers the same API when you also need node-level edits
+from linked_list_classes import DoublyLinkedList
+window = DoublyLinkedList(maxlen=3)  # append/appendleft/pop/popleft/rotate/[i]
         """, language="python")
     
     with tab2:
@@ -6791,22 +6783,21 @@ def advanced_algorithms():
     return merge(left, right)
 
 def merge(left, right):
-    if not left:
-        return right
-    if not right:
-        return left
-
-    if left.data <= right.data:
-        result = left
-        result.next = merge(left.next, right)
-    else:
-        result = right
-        result.next = merge(left, right.next)
-
-    return result
+    # Iterative, so long lists do not hit the recursion limit
+    dummy = tail = Node(0)
+    while left and right:
+        if left.data <= right.data:
+            tail.next, left = left, left.next
+        else:
+            tail.next, right = right, right.next
+        tail = tail.next
+    tail.next = left or right
+    return dummy.next
 
 # Time Complexity: O(n log n)
-# Space Complexity: O(log n) for recursion stack</code></pre>
+# Space Complexity: O(log n) for recursion stack
+# The list classes also provide ll.sort(key=None, reverse=False):
+# a bottom-up natural merge sort with no recursion at all</code></pre>
     </div>
     '''
     st.markdown(merge_sort_html, unsafe_allow_html=True)
@@ -7288,6 +7279,7 @@ def performance_benchmarks():
             'Size': [],
             'Operation': [],
             'Linked List (ms)': [],
+            'Skip List (ms)': [],
             'Array (ms)': []
         }
 
@@ -7322,8 +7314,15 @@ def performance_benchmarks():
                         current = current.next
                     return False
 
+                def get(self, index):
+                    current = self.head
+                    for _ in range(index):
+                        current = current.next
+                    return current.data
+
             # Create structures
             ll = LinkedList()
+            skip_list = IndexableSkipList()
             array = []
 
             # Insert at end - Linked List
@@ -7332,6 +7331,12 @@ def performance_benchmarks():
                 ll.insert_at_end(item)
             ll_insert_time = (time.time() - start_time) * 1000
 
+            # Insert at end - Skip List
+            start_time = time.time()
+            for item in test_data:
+                skip_list.insert_at_end(item)
+            skip_insert_time = (time.time() - start_time) * 1000
+
             # Insert at end - Array
             start_time = time.time()
             for item in test_data:
@@ -7344,17 +7349,40 @@ def performance_benchmarks():
                 ll.search(size // 2)
             ll_search_time = (time.time() - start_time) * 1000 / 100
 
+            # Search - Skip List
+            start_time = time.time()
+            for _ in range(100):  # Search 100 times
+                skip_list.search(size // 2)
+            skip_search_time = (time.time() - start_time) * 1000 / 100
+
             # Search - Array
             start_time = time.time()
             for _ in range(100):  # Search 100 times
                 (size // 2) in array
             array_search_time = (time.time() - start_time) * 1000 / 100
 
+            # Access by index - all three structures
+            start_time = time.time()
+            for _ in range(100):
+                ll.get(size // 2)
+            ll_access_time = (time.time() - start_time) * 1000 / 100
+
+            start_time = time.time()
+            for _ in range(100):
+                skip_list.get(size // 2)
+            skip_access_time = (time.time() - start_time) * 1000 / 100
+
+            start_time = time.time()
+            for _ in range(100):
+                array[size // 2]
+            array_access_time = (time.time() - start_time) * 1000 / 100
+
             # Record results
-            results['Size'].extend([size, size])
-            results['Operation'].extend(['Insert at End', 'Search'])
-            results['Linked List (ms)'].extend([ll_insert_time, ll_search_time])
-            results['Array (ms)'].extend([array_insert_time, array_search_time])
+            results['Size'].extend([size, size, size])
+            results['Operation'].extend(['Insert at End', 'Search', 'Access by Index'])
+            results['Linked List (ms)'].extend([ll_insert_time, ll_search_time, ll_access_time])
+            results['Skip List (ms)'].extend([skip_insert_time, skip_search_time, skip_access_time])
+            results['Array (ms)'].extend([array_insert_time, array_search_time, array_access_time])
 
         # Display results
         df = pd.DataFrame(results)
@@ -7363,7 +7391,7 @@ def performance_benchmarks():
         # Create comparison chart
         fig = go.Figure()
 
-        for op in ['Insert at End', 'Search']:
+        for op in ['Insert at End', 'Search', 'Access by Index']:
             op_data = df[df['Operation'] == op]
             fig.add_trace(go.Bar(
                 name=f'Linked List - {op}',
@@ -7371,6 +7399,12 @@ def performance_benchmarks():
                 y=op_data['Linked List (ms)'],
                 marker_color='#1e3c72'
             ))
+            fig.add_trace(go.Bar(
+                name=f'Skip List - {op}',
+                x=[f"Size {size}" for size in op_data['Size']],
+                y=op_data['Skip List (ms)'],
+                marker_color='#43a047'
+            ))
             fig.add_trace(go.Bar(
                 name=f'Array - {op}',
                 x=[f"Size {size}" for size in op_data['Size']],
@@ -0,0 +1,193 @@
+# List Aggregates
+# Gather a linked list's values into one contiguous buffer in a single pass, then
+# run vectorized kernels on it (NumPy when installed, array + builtins otherwise).
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the kernels fall back to array + builtins
+    np = None
+
+TYPECODES = {'int64': 'q', 'float64': 'd'}
+
+def _chunked(ll):
+    """Per-block value sequences of an UnrolledLinkedList / TypedLinkedList, else None"""
+    if hasattr(ll, '_blocks'):
+        return [block.elements for block in ll._blocks()]
+    return None
+
+def _infer_dtype(values):
+    """'int64' when every value is an int, else 'float64'"""
+    return 'int64' if all(isinstance(value, int) for value in values) else 'float64'
+
+def _pack(values, dtype):
+    """A buffer of dtype holding values (a NumPy array, or an array.array without NumPy)"""
+    if np is not None:
+        return np.array(values, dtype=dtype)
+    return array(TYPECODES[dtype], values)
+
+def gather(ll, dtype=None):
+    """Copy the list's values into one contiguous buffer in a single pass over the list.
+
+    Returns a NumPy array when NumPy is installed, otherwise an array.array.
+    dtype ('int64' or 'float64') defaults to the list's own: its typecode for
+    typed chunked lists, otherwise int64 when every value is an int, so large
+    integers are not rounded through float64. Typed chunked lists are
+    concatenated block by block instead of per value.
+    """
+    chunks = _chunked(ll)
+    if chunks is not None and all(type(chunk) is array for chunk in chunks) and ll.typecode:
+        if dtype is None:
+            dtype = 'float64' if ll.typecode in 'fd' else 'int64'
+        if np is not None:
+            if not chunks:
+                return np.empty(0, dtype=dtype)
+            return np.concatenate([np.frombuffer(chunk, dtype=chunk.typecode) for chunk in chunks]).astype(dtype, copy=False)
+        values = array(TYPECODES[dtype])
+        for chunk in chunks:
+            if chunk.typecode == values.typecode:
+                values.extend(chunk)
+            else:
+                values.extend(iter(chunk))
+        return values
+    if dtype is None:
+        items = list(ll)
+        return _pack(items, _infer_dtype(items))
+    if np is not None:
+        return np.fromiter(iter(ll), dtype=dtype, count=len(ll))
+    return array(TYPECODES[dtype], ll)
+
+def _may_overflow(values):
+    """True when summing an integer NumPy buffer in int64 could wrap"""
+    if values.dtype.kind not in 'iu' or len(values) == 0:
+        return False
+    return max(-int(values.min()), int(values.max())) * len(values) >= 2 ** 63
+
+def total(values):
+    """Sum of a gathered buffer; exact for integers, which may exceed int64"""
+    if np is not None and not _may_overflow(values):
+        return values.sum().item()
+    return sum(values.tolist())
+
+def mean(values):
+    """Arithmetic mean of a non-empty buffer"""
+    if len(values) == 0:
+        raise ValueError("mean of an empty list")
+    return total(values) / len(values)
+
+def minmax(values):
+    """(min, max) of a non-empty buffer"""
+    if len(values) == 0:
+        raise ValueError("minmax of an empty list")
+    if np is not None:
+        return values.min().item(), values.max().item()
+    return min(values), max(values)
+
+def prefix_sums(values):
+    """Running totals, as a buffer of the same kind; OverflowError if one exceeds int64"""
+    if np is not None:
+        if _may_overflow(values):
+            return np.array(list(accumulate(values.tolist())), dtype=values.dtype)
+        return np.cumsum(values)
+    return array(values.typecode, accumulate(values))
+
+def histogram(values, bins=10):
+    """(counts, edges) over bins equal-width bins spanning min..max, like numpy.histogram"""
+    if np is not None:
+        counts, edges = np.histogram(values, bins=bins)
+        return counts.tolist(), edges.tolist()
+    lo, hi = minmax(values) if len(values) else (0.0, 1.0)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    width = (hi - lo) / bins
+    edges = [lo + i * width for i in range(bins)] + [hi]
+    counts = [0] * bins
+    for value in values:
+        # The last bin is closed on the right, as in numpy.histogram
+        counts[min(bisect_right(edges, value) - 1, bins - 1)] += 1
+    return counts, edges
+
+def map_values(ll, func, dtype=None, in_place=False, vectorized=False):
+    """Apply func to every value and return the results as a buffer.
+
+    func is called once per value, with or without NumPy; vectorized=True
+    instead calls it once with the whole gathered buffer (a NumPy array, or
+    an array.array without NumPy) and expects one result per value. The
+    result dtype follows the results (int64 if all ints, else float64).
+    in_place=True also writes the results back into the list in one pass.
+    """
+    values = gather(ll, dtype)
+    if vectorized:
+        results = func(values)
+        if np is not None:
+            results = np.asarray(results)
+        elif type(results) is not array:
+            results = list(results)
+            results = _pack(results, _infer_dtype(results))
+    else:
+        results = [func(value) for value in values.tolist()]
+        results = _pack(results, _infer_dtype(results))
+    if len(results) != len(values):
+        raise ValueError("func must return one result per value")
+    if in_place:
+        write_back(ll, results)
+    return results
+
+def filter_values(ll, predicate, dtype=None, in_place=False, vectorized=False):
+    """Values for which predicate holds, as a buffer.
+
+    predicate is called once per value; vectorized=True instead calls it once
+    with the gathered buffer and expects a sequence of booleans (a mask).
+    in_place=True also removes the other elements from the list in a single
+    remove_if pass; lists without remove_if raise TypeError up front.
+    """
+    if in_place and not hasattr(ll, 'remove_if'):
+        raise TypeError(f"{type(ll).__name__} does not support in-place filtering (no remove_if)")
+    values = gather(ll, dtype)
+    if vectorized:
+        flags = [bool(flag) for flag in predicate(values)]
+        if len(flags) != len(values):
+            raise ValueError("predicate must return one flag per value")
+    else:
+        flags = [bool(predicate(value)) for value in values.tolist()]
+    if np is not None:
+        kept = values[np.array(flags, dtype=bool)]
+    else:
+        kept = array(values.typecode, (value for value, keep in zip(values, flags) if keep))
+    if in_place:
+        verdicts = iter(flags)
+        ll.remove_if(lambda data: not next(verdicts))
+    return kept
+
+def write_back(ll, results):
+    """Overwrite the list's values in order with results (same length) in one pass.
+
+    For typed chunked lists every result is checked against the list's
+    typecode first, so a result that does not fit leaves the list untouched.
+    """
+    if len(results) != len(ll):
+        raise ValueError("results must have one value per element")
+    # Plain Python numbers, so nodes never end up holding NumPy scalars
+    results = results.tolist()
+    chunks = _chunked(ll)
+    if chunks is not None:
+        if ll.typecode:
+            try:
+                results = array(ll.typecode, results)
+            except (TypeError, OverflowError) as exc:
+                raise ValueError(f"results do not fit typecode {ll.typecode!r}: {exc}") from None
+        start = 0
+        for chunk in chunks:
+            chunk[:] = results[start:start + len(chunk)]
+            start += len(chunk)
+        return
+    indexed = getattr(ll, '_index', None) is not None
+    for node, value in zip(ll._nodes(), results):
+        if indexed:
+            ll._index_discard(node)
+        node.data = value
+        if indexed:
+            ll._index_add(node)
@@ -0,0 +1,275 @@
+# List Storage
+# Versioned binary file format for linked lists: header, next/prev slot arrays and
+# fixed-width values (or an offset table of pickled values), with a lazy mmap reader.
+
+import mmap as mmap_module
+import pickle
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+
+from linked_list_classes import SinglyLinkedList, DoublyLinkedList, CircularLinkedList, _SequenceMixin
+
+MAGIC = b'LLSTORE\0'
+FORMAT_VERSION = 1
+# magic, version, header size, kind, value format, flags, count, head slot, tail slot
+HEADER = struct.Struct('<8sHHBBBxqqq')
+
+KINDS = [SinglyLinkedList, DoublyLinkedList, CircularLinkedList]
+INT64, FLOAT64, PICKLED = 0, 1, 2
+VALUE_TYPECODES = {INT64: 'q', FLOAT64: 'd'}
+FLAG_INDEXED = 1
+FLAG_SEQUENTIAL = 2  # slot i holds element i, so get() can skip the walk
+
+SLOT = array('q')
+if SLOT.itemsize != 8:
+    raise ImportError("list_storage needs an 8-byte array('q')")
+# Slot and value arrays are stored little-endian like the header; other hosts byteswap
+SWAP_BYTES = sys.byteorder != 'little'
+
+def _write_array(f, values):
+    if SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(f)
+
+def _read_array(view, typecode):
+    """view as typecode items: zero-copy on little-endian hosts, a swapped copy elsewhere"""
+    view = view.cast(typecode)
+    if not SWAP_BYTES:
+        return view
+    values = array(typecode, view)
+    view.release()
+    values.byteswap()
+    return values
+
+def _check_pickle(value_format, allow_pickle):
+    if value_format == PICKLED and not allow_pickle:
+        raise ValueError("file holds pickled values; pass allow_pickle=True only for trusted files")
+
+def _kind(ll):
+    if getattr(ll, 'circular', False):
+        return 2
+    return 1 if getattr(ll, 'has_prev', False) else 0
+
+def _value_format(values):
+    """INT64 or FLOAT64 when every value is exactly int or float and fits, else PICKLED"""
+    kinds = {type(value) for value in values}
+    if kinds == {int}:
+        try:
+            return INT64, array('q', values)
+        except OverflowError:
+            return PICKLED, None
+    if kinds == {float}:
+        return FLOAT64, array('d', values)
+    return PICKLED, None
+
+def save(ll, path):
+    """Write ll to path in list order; returns the number of bytes written"""
+    values = list(ll)
+    count = len(values)
+    kind = _kind(ll)
+    value_format, packed = _value_format(values) if count else (INT64, array('q'))
+    flags = FLAG_SEQUENTIAL | (FLAG_INDEXED if getattr(ll, 'indexed', False) else 0)
+    head, tail = (0, count - 1) if count else (-1, -1)
+    next_slots = array('q', range(1, count + 1))
+    if count:
+        next_slots[-1] = 0 if kind == 2 else -1
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, HEADER.size, kind, value_format, flags, count, head, tail))
+        _write_array(f, next_slots)
+        if kind == 1:
+            # prev of slot i is i - 1: the next array shifted by two, without a second range pass
+            _write_array(f, array('q', [-1, 0][:count]) + next_slots[:max(count - 2, 0)])
+        if value_format == PICKLED:
+            blobs = [pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for value in values]
+            _write_array(f, array('q', accumulate(map(len, blobs), initial=0)))
+            f.writelines(blobs)
+        else:
+            _write_array(f, packed)
+        return f.tell()
+
+def _read_header(buffer):
+    if len(buffer) < HEADER.size:
+        raise ValueError("not a linked list file (too short)")
+    magic, version, header_size, kind, value_format, flags, count, head, tail = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("not a linked list file (bad magic)")
+    if not 1 <= version <= FORMAT_VERSION:
+        raise ValueError(f"unsupported linked list file version {version}")
+    if header_size < HEADER.size or not 0 <= kind < len(KINDS) or value_format not in (INT64, FLOAT64, PICKLED):
+        raise ValueError("corrupt linked list file (bad header fields)")
+    ends_valid = (head, tail) == (-1, -1) if count == 0 else 0 <= head < count and 0 <= tail < count
+    if count < 0 or not ends_valid:
+        raise ValueError("corrupt linked list file (bad count or end slots)")
+    # Slot arrays (two for doubly linked lists), then values or an offset table and the blobs
+    slots_size = count * SLOT.itemsize
+    arrays_end = header_size + slots_size * (2 if kind == 1 else 1) + slots_size
+    if value_format == PICKLED:
+        arrays_end += SLOT.itemsize
+    if len(buffer) < arrays_end or (value_format != PICKLED and len(buffer) != arrays_end):
+        raise ValueError("corrupt linked list file (length does not match header)")
+    return header_size, kind, value_format, flags, count, head, tail
+
+def _check_blob(offsets, blob):
+    if offsets[0] != 0 or offsets[-1] != len(blob):
+        raise ValueError("corrupt linked list file (pickled value table does not match its data)")
+
+class MappedLinkedList(_SequenceMixin):
+    """Read-only linked list backed by a memory-mapped file.
+
+    Nothing is materialised up front: traversal follows the next-slot array
+    and decodes each value as it is reached, so the OS pages the file in on
+    demand and pages out clean pages under memory pressure. (On big-endian
+    hosts the arrays are byteswapped into memory when the file is opened.)
+    """
+    def __init__(self, path, allow_pickle=False):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap_module.mmap(self._file.fileno(), 0, access=mmap_module.ACCESS_READ)
+            self._open(allow_pickle)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, allow_pickle):
+        self._view = view = memoryview(self._map)
+        header_size, kind, value_format, flags, count, head, tail = _read_header(view)
+        _check_pickle(value_format, allow_pickle)
+        self.size = count
+        self.list_class = KINDS[kind]
+        self.indexed = bool(flags & FLAG_INDEXED)
+        self._sequential = bool(flags & FLAG_SEQUENTIAL)
+        self._head, self._tail = head, tail
+        self._value_format = value_format
+        offset = header_size
+        slots_size = count * SLOT.itemsize
+        self._next = _read_array(view[offset:offset + slots_size], 'q')
+        offset += slots_size
+        self._prev = None
+        if kind == 1:
+            self._prev = _read_array(view[offset:offset + slots_size], 'q')
+            offset += slots_size
+        if value_format == PICKLED:
+            self._offsets = _read_array(view[offset:offset + slots_size + SLOT.itemsize], 'q')
+            self._blob = view[offset + slots_size + SLOT.itemsize:]
+            _check_blob(self._offsets, self._blob)
+        else:
+            self._values = _read_array(view[offset:offset + slots_size], VALUE_TYPECODES[value_format])
+
+    def _value(self, slot):
+        if self._value_format == PICKLED:
+            return pickle.loads(self._blob[self._offsets[slot]:self._offsets[slot + 1]])
+        return self._values[slot]
+
+    def _slots(self):
+        slot = self._head
+        for _ in range(self.size):
+            yield slot
+            slot = self._next[slot]
+
+    def __iter__(self):
+        return map(self._value, self._slots())
+
+    def __reversed__(self):
+        if self._prev is None:
+            return reversed(list(self))
+        return map(self._value, self._slots_backward())
+
+    def _slots_backward(self):
+        slot = self._tail
+        for _ in range(self.size):
+            yield slot
+            slot = self._prev[slot]
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def get(self, index):
+        """Return the value at index (negative indexes count from the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        if self._sequential:
+            return self._value(index)
+        return self._value(next(islice(self._slots(), index, None)))
+
+    def search(self, value):
+        for position, data in enumerate(self):
+            if data == value:
+                return position
+        return -1
+
+    def page(self, number, page_size=20):
+        """Return the values on page `number` (0-based) of size page_size"""
+        if self._sequential:
+            stop = min((number + 1) * page_size, self.size)
+            return [self._value(slot) for slot in range(number * page_size, stop)]
+        return list(self.islice(number * page_size, (number + 1) * page_size))
+
+    def traverse(self):
+        return list(self)
+
+    def materialize(self):
+        """Build an ordinary, mutable linked list of the stored kind"""
+        return self.list_class.from_iterable(self, indexed=self.indexed)
+
+    def close(self):
+        """Release the views and the mapping; the list is unusable afterwards"""
+        # Derived views first: the base view cannot be released while they export it
+        for name in ('_next', '_prev', '_offsets', '_blob', '_values', '_view'):
+            view = self.__dict__.pop(name, None)
+            if type(view) is memoryview:
+                view.release()
+        if '_map' in self.__dict__:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _repr_fields(self):
+        return f"size={self.size}, kind={self.list_class.__name__}"
+
+def load(path, mmap=True, allow_pickle=False):
+    """Open a saved list: a lazy read-only MappedLinkedList, or with mmap=False a new list.
+
+    Files whose values are not all plain ints or floats store them pickled,
+    and unpickling can run arbitrary code. Such files are refused with
+    ValueError unless allow_pickle=True; only pass it for files you trust.
+    Files whose header fields or length do not add up also raise ValueError.
+    """
+    if mmap:
+        return MappedLinkedList(path, allow_pickle)
+    with open(path, 'rb') as f:
+        data = f.read()
+    view = memoryview(data)
+    header_size, kind, value_format, flags, count, head, tail = _read_header(view)
+    _check_pickle(value_format, allow_pickle)
+    offset = header_size + count * SLOT.itemsize * (2 if kind == 1 else 1)
+    next_slots = _read_array(view[header_size:header_size + count * SLOT.itemsize], 'q')
+    if value_format == PICKLED:
+        offsets = _read_array(view[offset:offset + (count + 1) * SLOT.itemsize], 'q')
+        blob = view[offset + (count + 1) * SLOT.itemsize:]
+        _check_blob(offsets, blob)
+        decode = lambda slot: pickle.loads(blob[offsets[slot]:offsets[slot + 1]])
+    else:
+        stored = _read_array(view[offset:offset + count * SLOT.itemsize], VALUE_TYPECODES[value_format])
+        if flags & FLAG_SEQUENTIAL:
+            return KINDS[kind].from_iterable(stored.tolist(), indexed=bool(flags & FLAG_INDEXED))
+        decode = stored.__getitem__
+
+    def slots():
+        slot = head
+        for _ in range(count):
+            yield slot
+            slot = next_slots[slot]
+    return KINDS[kind].from_iterable(map(decode, slots()), indexed=bool(flags & FLAG_INDEXED))
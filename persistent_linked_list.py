@@ -0,0 +1,225 @@
+# Persistent Linked List
+# Immutable singly linked list: every update returns a new version that shares
+# the unchanged suffix with the old one, plus a version history with undo/redo.
+
+from itertools import islice
+
+from linked_list_classes import _SequenceMixin
+
+class PersistentNode:
+    """Node that is never modified once it is linked into a version"""
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+class PersistentLinkedList(_SequenceMixin):
+    """Immutable singly linked list with structural sharing.
+
+    cons/tail are O(1) and allocate at most one node. insert_at_index,
+    delete_at_index and delete_by_value copy only the nodes before the change
+    and share everything after it, so older versions stay valid and cheap.
+    """
+    __slots__ = ('head', 'size')
+
+    def __init__(self, values=()):
+        head = None
+        size = 0
+        for data in reversed(list(values)):
+            head = PersistentNode(data, head)
+            size += 1
+        self.head = head
+        self.size = size
+
+    @classmethod
+    def from_iterable(cls, values):
+        return cls(values)
+
+    @classmethod
+    def _from_head(cls, head, size):
+        ll = cls.__new__(cls)
+        ll.head = head
+        ll.size = size
+        return ll
+
+    def _copy_prefix(self, count, rest):
+        """Fresh copies of the first count nodes, linked in front of rest"""
+        values = list(islice(self, count))
+        for data in reversed(values):
+            rest = PersistentNode(data, rest)
+        return rest
+
+    def _node_at(self, index):
+        node = self.head
+        for i in range(index):
+            node = node.next
+        return node
+
+    def cons(self, data):
+        """New version with data in front (O(1))"""
+        return self._from_head(PersistentNode(data, self.head), self.size + 1)
+
+    def tail(self):
+        """New version without the first element (O(1), no allocation)"""
+        if self.head is None:
+            raise IndexError("tail of empty list")
+        return self._from_head(self.head.next, self.size - 1)
+
+    def first(self):
+        if self.head is None:
+            raise IndexError("first of empty list")
+        return self.head.data
+
+    def insert_at_beginning(self, data):
+        return self.cons(data)
+
+    def insert_at_end(self, data):
+        """New version with data appended; nothing can be shared, so this copies every node"""
+        return self.insert_at_index(data, self.size)
+
+    def insert_at_index(self, data, index):
+        """New version with data at index; copies the index nodes in front of it"""
+        if index < 0 or index > self.size:
+            raise IndexError("linked list index out of range")
+        rest = PersistentNode(data, self._node_at(index))
+        return self._from_head(self._copy_prefix(index, rest), self.size + 1)
+
+    def delete_from_beginning(self):
+        return self.tail() if self.head is not None else self
+
+    def delete_at_index(self, index):
+        """New version without the element at index"""
+        if index < 0 or index >= self.size:
+            raise IndexError("linked list index out of range")
+        rest = self._node_at(index).next
+        return self._from_head(self._copy_prefix(index, rest), self.size - 1)
+
+    def delete_by_value(self, value):
+        """New version without the first occurrence of value (self if absent)"""
+        position = self.search(value)
+        if position == -1:
+            return self
+        return self.delete_at_index(position)
+
+    def set(self, index, data):
+        """New version with the element at index replaced"""
+        if index < 0 or index >= self.size:
+            raise IndexError("linked list index out of range")
+        rest = PersistentNode(data, self._node_at(index).next)
+        return self._from_head(self._copy_prefix(index, rest), self.size)
+
+    def get(self, index):
+        """Return the value at index (negative indexes count from the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        return self._node_at(index).data
+
+    def search(self, value):
+        position = 0
+        for data in self:
+            if data == value:
+                return position
+            position += 1
+        return -1
+
+    def shared_nodes(self, other):
+        """Number of nodes this version shares with other (their common suffix)"""
+        a, b = self.head, other.head
+        # Walk the longer list down to the same length, then advance in step
+        for i in range(self.size - other.size):
+            a = a.next
+        for i in range(other.size - self.size):
+            b = b.next
+        while a is not b:
+            a, b = a.next, b.next
+        shared = 0
+        while a is not None:
+            shared += 1
+            a = a.next
+        return shared
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        if self.head is other.head:
+            return True
+        return self.size == other.size and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Pickle the values flat; the default would recurse once per node
+        return (type(self), (list(self),))
+
+    def traverse(self):
+        return list(self)
+
+class VersionHistory:
+    """Linear history of PersistentLinkedList versions addressed by integer handles.
+
+    Each version is just a reference to an immutable list, so keeping a version
+    costs only the nodes its change allocated. Committing after undo() drops
+    the versions that could have been redone.
+    """
+    def __init__(self, initial=None):
+        self._versions = [PersistentLinkedList() if initial is None else initial]
+        self._position = 0
+
+    @property
+    def current(self):
+        return self._versions[self._position]
+
+    @property
+    def version(self):
+        """Handle of the current version"""
+        return self._position
+
+    def commit(self, ll):
+        """Make ll the current version and return its handle"""
+        del self._versions[self._position + 1:]
+        self._versions.append(ll)
+        self._position += 1
+        return self._position
+
+    def apply(self, method, *args):
+        """Commit the result of calling a PersistentLinkedList method on the current version"""
+        return self.commit(getattr(self.current, method)(*args))
+
+    def checkout(self, version):
+        """Read-only view of an earlier version"""
+        if not 0 <= version < len(self._versions):
+            raise IndexError("unknown version")
+        return self._versions[version]
+
+    def undo(self):
+        if self._position == 0:
+            return None
+        self._position -= 1
+        return self.current
+
+    def redo(self):
+        if self._position + 1 >= len(self._versions):
+            return None
+        self._position += 1
+        return self.current
+
+    def __len__(self):
+        return len(self._versions)
@@ -0,0 +1,176 @@
+# Self-Organizing List
+# Linked list that reorders itself on every successful lookup so frequently
+# accessed keys drift towards the head, plus workload generators to measure it.
+
+import random
+
+class SelfOrganizingNode:
+    """Singly linked node with an access counter"""
+    __slots__ = ('data', 'next', 'count')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.count = 0
+
+# Strategies receive the list, the node that was hit and the nodes around it:
+# prev (node before it), prev_prev (node before prev) and run_prev (node before
+# the first node whose count equals the hit node's count before this access).
+# Any callable with this signature can be passed as a strategy.
+
+def static(ol, node, prev, prev_prev, run_prev):
+    """Never reorder (baseline)"""
+
+def move_to_front(ol, node, prev, prev_prev, run_prev):
+    """Move the accessed node to the head"""
+    if prev is None:
+        return
+    ol._unlink_after(prev, node)
+    ol._link_after(None, node)
+
+def transpose(ol, node, prev, prev_prev, run_prev):
+    """Swap the accessed node with its predecessor"""
+    if prev is None:
+        return
+    ol._unlink_after(prev, node)
+    ol._link_after(prev_prev, node)
+
+def count_ordered(ol, node, prev, prev_prev, run_prev):
+    """Keep nodes sorted by access count, most frequent first"""
+    if prev is None or prev is run_prev:
+        return
+    # Every node between run_prev and node had the same count, now lower than node's
+    ol._unlink_after(prev, node)
+    ol._link_after(run_prev, node)
+
+STRATEGIES = {
+    'static': static,
+    'mtf': move_to_front,
+    'transpose': transpose,
+    'count': count_ordered,
+}
+
+class SelfOrganizingList:
+    """Self-organizing singly linked list with pluggable reordering strategies"""
+    def __init__(self, strategy='mtf'):
+        self.strategy = STRATEGIES[strategy] if isinstance(strategy, str) else strategy
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reset_stats()
+
+    @classmethod
+    def from_iterable(cls, values, **options):
+        ll = cls(**options)
+        for data in values:
+            ll.insert(data)
+        return ll
+
+    def reset_stats(self):
+        self.accesses = 0
+        self.hits = 0
+        self.probes = 0
+
+    def stats(self):
+        """Hit and probe-length statistics since the last reset_stats()"""
+        return {
+            'accesses': self.accesses,
+            'hits': self.hits,
+            'misses': self.accesses - self.hits,
+            'hit_ratio': self.hits / self.accesses if self.accesses else 0.0,
+            'probes': self.probes,
+            'avg_probe_length': self.probes / self.accesses if self.accesses else 0.0,
+        }
+
+    def _unlink_after(self, prev, node):
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+
+    def _link_after(self, prev, node):
+        if prev is None:
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+        if node.next is None:
+            self.tail = node
+
+    def insert(self, data):
+        """Append a new key with a zero access count"""
+        node = SelfOrganizingNode(data)
+        if self.tail is None:
+            self.head = self.tail = node
+        else:
+            self.tail.next = node
+            self.tail = node
+        self.size += 1
+
+    def search(self, key):
+        """Return the key's position before reordering, or -1; counts as one access"""
+        self.accesses += 1
+        prev_prev = prev = run_prev = None
+        current = self.head
+        position = 0
+        while current is not None:
+            if prev is not None and current.count != prev.count:
+                run_prev = prev
+            if current.data == key:
+                self.probes += position + 1
+                self.hits += 1
+                current.count += 1
+                self.strategy(self, current, prev, prev_prev, run_prev)
+                return position
+            prev_prev, prev = prev, current
+            current = current.next
+            position += 1
+        self.probes += position
+        return -1
+
+    def access(self, key):
+        """Look up key, reorganizing on a hit; return True if it was found"""
+        return self.search(key) != -1
+
+    def delete(self, key):
+        prev = None
+        current = self.head
+        while current is not None:
+            if current.data == key:
+                self._unlink_after(prev, current)
+                self.size -= 1
+                return True
+            prev, current = current, current.next
+        return False
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __len__(self):
+        return self.size
+
+    def traverse(self):
+        return list(self)
+
+def uniform_workload(keys, length, seed=None):
+    """length lookups drawn uniformly from keys"""
+    rnd = random.Random(seed)
+    return rnd.choices(keys, k=length)
+
+def zipf_workload(keys, length, s=1.0, seed=None):
+    """length lookups where the k-th most popular key has weight 1 / k**s.
+
+    Popularity ranks are assigned in a shuffled order, so hot keys do not start
+    near the head of a list built from keys.
+    """
+    rnd = random.Random(seed)
+    ranked = list(keys)
+    rnd.shuffle(ranked)
+    weights = [1.0 / (rank ** s) for rank in range(1, len(ranked) + 1)]
+    return rnd.choices(ranked, weights=weights, k=length)
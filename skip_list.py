@@ -0,0 +1,140 @@
+# Skip List
+# Ordered key/value map built on a probabilistic skip list: O(log n) expected
+# insert, delete and lookup, plus ordered iteration and streaming range scans.
+
+import random
+
+class SkipListNode:
+    """Map entry with one forward pointer per level it participates in"""
+    __slots__ = ('key', 'value', 'forward')
+
+    def __init__(self, key, value, level):
+        self.key = key
+        self.value = value
+        self.forward = [None] * level
+
+class SkipList:
+    """Ordered map; keys must be mutually comparable with <"""
+    def __init__(self, max_level=16, p=0.5, seed=None):
+        if max_level < 1:
+            raise ValueError("max_level must be at least 1")
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.max_level = max_level
+        self.p = p
+        self.level = 1
+        self.header = SkipListNode(None, None, max_level)
+        self.size = 0
+        self._random = random.Random(seed)
+
+    def _random_level(self):
+        level = 1
+        while level < self.max_level and self._random.random() < self.p:
+            level += 1
+        return level
+
+    def _find_update(self, key):
+        """Per-level rightmost node with node.key < key"""
+        update = [self.header] * self.max_level
+        x = self.header
+        for i in range(self.level - 1, -1, -1):
+            nxt = x.forward[i]
+            while nxt is not None and nxt.key < key:
+                x = nxt
+                nxt = x.forward[i]
+            update[i] = x
+        return update
+
+    def _lower_bound(self, key):
+        """First node with node.key >= key, or None"""
+        x = self.header
+        for i in range(self.level - 1, -1, -1):
+            nxt = x.forward[i]
+            while nxt is not None and nxt.key < key:
+                x = nxt
+                nxt = x.forward[i]
+        return x.forward[0]
+
+    def insert(self, key, value=None):
+        """Insert or replace key; return True if the key was new"""
+        update = self._find_update(key)
+        node = update[0].forward[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return False
+        level = self._random_level()
+        if level > self.level:
+            self.level = level
+        node = SkipListNode(key, value, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+        self.size += 1
+        return True
+
+    def delete(self, key):
+        """Remove key; return True if it was present"""
+        update = self._find_update(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return False
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return True
+
+    def search(self, key):
+        """Return the value stored for key, or None"""
+        node = self._lower_bound(key)
+        if node is not None and node.key == key:
+            return node.value
+        return None
+
+    def get(self, key, default=None):
+        node = self._lower_bound(key)
+        if node is not None and node.key == key:
+            return node.value
+        return default
+
+    def range(self, lo=None, hi=None):
+        """Yield (key, value) pairs with lo <= key < hi in order; None leaves a side open"""
+        node = self.header.forward[0] if lo is None else self._lower_bound(lo)
+        while node is not None and (hi is None or node.key < hi):
+            yield node.key, node.value
+            node = node.forward[0]
+
+    def items(self):
+        return self.range()
+
+    def keys(self):
+        for key, _ in self.range():
+            yield key
+
+    def values(self):
+        for _, value in self.range():
+            yield value
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        node = self._lower_bound(key)
+        return node is not None and node.key == key
+
+    def __getitem__(self, key):
+        node = self._lower_bound(key)
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
@@ -0,0 +1,85 @@
+# Typed Linked List
+# Numeric linked list that stores values unboxed in array(typecode) chunks,
+# exposing each chunk through the buffer protocol for copy-free aggregates.
+
+from array import array
+
+from unrolled_linked_list import UnrolledLinkedList
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; aggregates fall back to the builtins
+    np = None
+
+NUMERIC_TYPECODES = 'bBhHiIlLqQfd'
+
+class TypedLinkedList(UnrolledLinkedList):
+    """Unrolled linked list of machine numbers declared by an array typecode.
+
+    Each block is an array(typecode) of up to block_size values, so an integer
+    or float costs its itemsize instead of a Node plus a boxed object. chunks()
+    hands out memoryviews of the blocks; with NumPy installed, sum/mean/min/max
+    reduce them through numpy.frombuffer without copying.
+    """
+    def __init__(self, typecode='q', block_size=1024):
+        if typecode not in NUMERIC_TYPECODES:
+            raise ValueError(f"typecode must be one of {NUMERIC_TYPECODES!r}")
+        super().__init__(block_size=block_size, typecode=typecode)
+
+    @property
+    def itemsize(self):
+        return array(self.typecode).itemsize
+
+    def chunks(self):
+        """Yield a memoryview of each block's values (zero-copy, buffer protocol)"""
+        for block in self._blocks():
+            yield memoryview(block.elements)
+
+    def _numpy_chunks(self):
+        for block in self._blocks():
+            yield np.frombuffer(block.elements, dtype=block.elements.typecode)
+
+    def to_array(self):
+        """Copy every value into one contiguous array(typecode)"""
+        values = array(self.typecode)
+        for block in self._blocks():
+            values.extend(block.elements)
+        return values
+
+    def sum(self):
+        """Exact for integer typecodes: a block that could overflow int64 is summed as Python ints"""
+        if np is None:
+            return sum(sum(block.elements) for block in self._blocks())
+        if self.typecode in 'fd':
+            return sum(chunk.sum().item() for chunk in self._numpy_chunks())
+        total = 0
+        for block in self._blocks():
+            chunk = np.frombuffer(block.elements, dtype=block.elements.typecode)
+            if len(chunk) == 0:
+                continue
+            bound = max(-int(chunk.min()), int(chunk.max())) * len(chunk)
+            total += chunk.sum(dtype=np.int64).item() if bound < 2 ** 63 else sum(block.elements)
+        return total
+
+    def mean(self):
+        if self.size == 0:
+            raise ValueError("mean of an empty list")
+        return self.sum() / self.size
+
+    def min(self):
+        if self.size == 0:
+            raise ValueError("min of an empty list")
+        if np is not None:
+            return min(chunk.min().item() for chunk in self._numpy_chunks())
+        return min(min(block.elements) for block in self._blocks())
+
+    def max(self):
+        if self.size == 0:
+            raise ValueError("max of an empty list")
+        if np is not None:
+            return max(chunk.max().item() for chunk in self._numpy_chunks())
+        return max(max(block.elements) for block in self._blocks())
+
+    def nbytes(self):
+        """Bytes held by the value arrays (excluding per-block object overhead)"""
+        return sum(block.elements.buffer_info()[1] for block in self._blocks()) * self.itemsize
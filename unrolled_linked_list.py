@@ -0,0 +1,296 @@
+# Unrolled Linked List
+# Each node holds a small array of elements, so most walks and searches run over
+# contiguous storage and there is one node object per block rather than per element.
+
+from array import array
+from itertools import chain, islice
+
+from linked_list_classes import _SequenceMixin
+
+class UnrolledNode:
+    """Block of up to capacity elements plus a pointer to the next block"""
+    __slots__ = ('elements', 'next')
+
+    def __init__(self, typecode=None, values=()):
+        self.elements = array(typecode, values) if typecode else list(values)
+        self.next = None
+
+class UnrolledLinkedList(_SequenceMixin):
+    """Unrolled linked list with the SinglyLinkedList API.
+
+    Blocks split in half when an insert finds them full, and a block that
+    drops below half full borrows from or merges with its successor.
+    typecode (e.g. 'q' or 'd') stores each block as an unboxed array.
+    """
+    def __init__(self, block_size=64, typecode=None):
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self.typecode = typecode
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def _options(self):
+        """Constructor options a copy should inherit"""
+        return {'block_size': self.block_size, 'typecode': self.typecode}
+
+    def _new_block(self, values=()):
+        return UnrolledNode(self.typecode, values)
+
+    def _blocks(self):
+        block = self.head
+        while block:
+            yield block
+            block = block.next
+
+    def _locate(self, index):
+        """(previous block, block, offset) for a valid element index"""
+        prev, block = None, self.head
+        while index >= len(block.elements):
+            index -= len(block.elements)
+            prev, block = block, block.next
+        return prev, block, index
+
+    def _split(self, block, offset):
+        """Move elements from offset on into a new successor block and return it"""
+        new_block = self._new_block(block.elements[offset:])
+        del block.elements[offset:]
+        new_block.next = block.next
+        block.next = new_block
+        if block is self.tail:
+            self.tail = new_block
+        return new_block
+
+    def _unlink(self, prev, block):
+        if prev is None:
+            self.head = block.next
+        else:
+            prev.next = block.next
+        if block is self.tail:
+            self.tail = prev
+
+    def _rebalance(self, prev, block):
+        """Restore the half-full invariant after removing from block"""
+        if not block.elements:
+            self._unlink(prev, block)
+            return
+        half = self.block_size // 2
+        nxt = block.next
+        if len(block.elements) >= half or nxt is None:
+            return
+        if len(block.elements) + len(nxt.elements) <= self.block_size:
+            block.elements.extend(nxt.elements)
+            self._unlink(block, nxt)
+        else:
+            borrow = half - len(block.elements)
+            block.elements.extend(nxt.elements[:borrow])
+            del nxt.elements[:borrow]
+
+    def insert_at_beginning(self, data):
+        self.insert_at_index(data, 0)
+
+    def insert_at_end(self, data):
+        tail = self.tail
+        if tail is None:
+            self.head = self.tail = self._new_block((data,))
+        elif len(tail.elements) >= self.block_size:
+            # Start a fresh block rather than splitting, so appends leave blocks full
+            tail.next = self._new_block((data,))
+            self.tail = tail.next
+        else:
+            tail.elements.append(data)
+        self.size += 1
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        prev, block, offset = self._locate(index)
+        if len(block.elements) >= self.block_size:
+            new_block = self._split(block, len(block.elements) // 2)
+            if offset > len(block.elements):
+                offset -= len(block.elements)
+                block = new_block
+        block.elements.insert(offset, data)
+        self.size += 1
+        return True
+
+    def extend(self, values):
+        """Append values, filling the tail block and then whole new blocks a slice at a time"""
+        values = iter(values)
+        capacity = self.block_size
+        while True:
+            tail = self.tail
+            if tail is None or len(tail.elements) >= capacity:
+                block = self._new_block()
+            else:
+                block = tail
+            before = len(block.elements)
+            try:
+                block.elements.extend(islice(values, capacity - before))
+            finally:
+                # Count what landed even if a value was rejected part way through
+                added = len(block.elements) - before
+                if added and block is not tail:
+                    if tail is None:
+                        self.head = block
+                    else:
+                        tail.next = block
+                    self.tail = block
+                self.size += added
+            if before + added < capacity:
+                return
+
+    def extend_left(self, values):
+        """Prepend values as a block, keeping their order"""
+        self.insert_many_at_index(values, 0)
+
+    def insert_many_at_index(self, values, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == self.size:
+            self.extend(values)
+            return True
+        # Build the batch as its own run of full blocks, then splice it in
+        batch = UnrolledLinkedList(self.block_size, self.typecode)
+        batch.extend(values)
+        if batch.size == 0:
+            return True
+        prev, block, offset = self._locate(index)
+        if offset:
+            prev, block = block, self._split(block, offset)
+        if prev is None:
+            self.head = batch.head
+        else:
+            prev.next = batch.head
+        batch.tail.next = block
+        self.size += batch.size
+        return True
+
+    def _prev_of(self, target):
+        prev = None
+        for block in self._blocks():
+            if block is target:
+                return prev
+            prev = block
+        return None
+
+    def delete_at_index(self, index):
+        if index < 0 or index >= self.size:
+            return None
+        prev, block, offset = self._locate(index)
+        deleted_data = block.elements.pop(offset)
+        self._rebalance(prev, block)
+        self.size -= 1
+        return deleted_data
+
+    def delete_from_beginning(self):
+        if self.head is None:
+            return None
+        deleted_data = self.head.elements.pop(0)
+        self._rebalance(None, self.head)
+        self.size -= 1
+        return deleted_data
+
+    def delete_from_end(self):
+        tail = self.tail
+        if tail is None:
+            return None
+        deleted_data = tail.elements.pop()
+        if not tail.elements:
+            self._unlink(self._prev_of(tail), tail)
+        self.size -= 1
+        return deleted_data
+
+    def delete_by_value(self, value):
+        prev = None
+        for block in self._blocks():
+            try:
+                offset = block.elements.index(value)
+            except (ValueError, TypeError):
+                prev = block
+                continue
+            del block.elements[offset]
+            self._rebalance(prev, block)
+            self.size -= 1
+            return True
+        return False
+
+    def remove_if(self, predicate):
+        """Remove every element for which predicate(value) is true in one pass; return how many.
+
+        Each block is filtered in place, then blocks left under half full are
+        merged or refilled from their successors in a second walk over the blocks.
+        """
+        removed = 0
+        try:
+            for block in self._blocks():
+                kept = [value for value in block.elements if not predicate(value)]
+                if len(kept) < len(block.elements):
+                    removed += len(block.elements) - len(kept)
+                    del block.elements[:]
+                    block.elements.extend(kept)
+        finally:
+            self.size -= removed
+            half = self.block_size // 2
+            prev, block = None, self.head
+            while block is not None:
+                if not block.elements:
+                    self._unlink(prev, block)
+                    block = block.next
+                    continue
+                while len(block.elements) < half and block.next is not None:
+                    self._rebalance(prev, block)
+                prev, block = block, block.next
+        return removed
+
+    def search(self, value):
+        position = 0
+        for block in self._blocks():
+            try:
+                return position + block.elements.index(value)
+            except (ValueError, TypeError):
+                position += len(block.elements)
+        return -1
+
+    def get(self, index):
+        """Return the value at index (negative indexes count from the end)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        _, block, offset = self._locate(index)
+        return block.elements[offset]
+
+    def __iter__(self):
+        return chain.from_iterable(block.elements for block in self._blocks())
+
+    def __reversed__(self):
+        # Blocks are singly linked, so walk them forward and replay in reverse
+        for block in reversed(list(self._blocks())):
+            yield from reversed(block.elements)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def traverse(self):
+        return list(self)
+
+    def stats(self):
+        """Block count and fill ratios"""
+        fills = [len(block.elements) for block in self._blocks()]
+        blocks = len(fills)
+        return {
+            'blocks': blocks,
+            'elements': self.size,
+            'block_size': self.block_size,
+            'fill_ratio': self.size / (blocks * self.block_size) if blocks else 0.0,
+            'min_fill': min(fills) if fills else 0,
+            'max_fill': max(fills) if fills else 0,
+        }
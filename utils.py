@@ -58,9 +58,10 @@ def format_complexity_table_data():
             'Traversal',
             'Access by Index'
         ],
-        'Singly Linked List': [1, 'n', 'n', 1, 'n', 'n', 'n', 'n', 'n'],
+        'Singly Linked List': [1, 1, 'n', 1, 'n', 'n', 'n', 'n', 'n'],
         'Doubly Linked List': [1, 1, 'n', 1, 1, 'n', 'n', 'n', 'n'],
-        'Circular Linked List': [1, 'n', 'n', 1, 'n', 'n', 'n', 'n', 'n'],
+        'Circular Linked List': [1, 1, 'n', 1, 'n', 'n', 'n', 'n', 'n'],
+        'Indexable Skip List': ['log n', 'log n', 'log n', 'log n', 'log n', 'log n', 'log n', 'n', 'log n'],
         'Dynamic Array': ['n', 1, 'n', 'n', 1, 'n', 'n', 'n', 1]
     }
 